@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Command:
     aliases: frozenset[str]
     description: str
@@ -105,16 +105,24 @@ class CommandRegistry:
         for command in excluded_commands:
             self.commands.pop(command, None)
 
-        self._alias_map = {}
-        for cmd_name, cmd in self.commands.items():
-            for alias in cmd.aliases:
-                self._alias_map[alias] = cmd_name
+        self._alias_map: dict[str, Command] = {
+            alias: cmd for cmd in self.commands.values() for alias in cmd.aliases
+        }
+        self._help_text: str | None = None
 
     def find_command(self, user_input: str) -> Command | None:
-        cmd_name = self._alias_map.get(user_input.lower().strip())
-        return self.commands.get(cmd_name) if cmd_name else None
+        return self._alias_map.get(user_input.lower().strip())
+
+    def get_command(self, alias: str) -> Command | None:
+        """Look up an alias the caller has already stripped and lowercased."""
+        return self._alias_map.get(alias)
 
     def get_help_text(self) -> str:
+        if self._help_text is None:
+            self._help_text = self._build_help_text()
+        return self._help_text
+
+    def _build_help_text(self) -> str:
         lines: list[str] = [
             "### Keyboard Shortcuts",
             "",
@@ -5,14 +5,22 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cache, cached_property, partial
 import logging
 import os
 from pathlib import Path
+import random
 import re
+import secrets
 import sys
 import traceback
-from typing import TYPE_CHECKING, ClassVar
-from uuid import uuid4
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Final
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from textual import on, work
 from textual.app import App, ComposeResult
@@ -22,7 +30,12 @@ from textual.widgets import Input
 
 from chefchat.cli.commands import CommandRegistry
 from chefchat.core.agent import Agent
-from chefchat.core.config import MissingAPIKeyError, VibeConfig, load_api_keys_from_env
+from chefchat.core.config import (
+    CONFIG_FILE,
+    MissingAPIKeyError,
+    VibeConfig,
+    load_api_keys_from_env,
+)
 from chefchat.core.types import (
     AssistantEvent,
     CompactEndEvent,
@@ -32,10 +45,10 @@ from chefchat.core.types import (
 )
 from chefchat.interface.constants import (
     MARKDOWN_SANITIZE_CHARS,
+    STATION_STATUS_MAP,
     BusAction,
     PayloadKey,
     StationStatus,
-    StatusString,
     TUILayout,
 )
 from chefchat.interface.screens.confirm_restart import (
@@ -61,24 +74,318 @@ from chefchat.kitchen.bus import ChefMessage, KitchenBus, MessagePriority
 from chefchat.modes import MODE_CONFIGS, MODE_CYCLE_ORDER, ModeManager, VibeMode
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Awaitable, Callable, Coroutine, Mapping
+
+    from chefchat.core.config import MCPServer
+    from chefchat.core.tools.executor import SecureCommandExecutor
+
+    BusHandler = Callable[[dict[str, Any]], Awaitable[None]]
 
 logger = logging.getLogger(__name__)
 
+_TASTE_TEST_ACTION = BusAction.TASTE_TEST.value
+# The Expeditor only iterates this, so one shared tuple serves every ticket
+_TASTE_TESTS: Final[tuple[str, ...]] = ("pytest", "ruff")
+
+
+BUS_INBOX_SIZE = 1024
+MODEL_SAVE_DEBOUNCE = 0.5  # seconds
+STREAM_FLUSH_INTERVAL = 1 / 60  # seconds; one ticket-rail render per frame
+LAYOUT_RESTART_DELAY = 0.1  # seconds; just long enough to paint the toast
+SHUTDOWN_SETTLE_TIMEOUT = 5.0  # seconds to let clears and saves finish on quit
+
+_status_map_get = STATION_STATUS_MAP.get
+_random_choice = random.choice
+# .env values only ever fill gaps in os.environ, so once per process is enough
+# for startup and layout restarts; onboarding reloads explicitly after a save.
+_load_api_keys_once = cache(load_api_keys_from_env)
+
+# System-message templates; only the mode/model parts vary per call
+_WELCOME_TEMPLATE: Final[str] = (
+    "🍽️ **Welcome to ChefChat!**\n\n"
+    "The kitchen is ready, Chef. What would you like to cook today?\n\n"
+    "*Current Mode: {emoji} {mode}*\n\n"
+    "{status}\n\n"
+    "*Commands: `/help` for menu, `/modes` to see modes, `Shift+Tab` to cycle*"
+)
+_BRIGADE_ACTIVE: Final[str] = "🟢 **Brigade Active**"
+_STANDALONE: Final[str] = "💤 *Standalone Mode*"
+_AGENT_CONNECTED_TEMPLATE: Final[str] = (
+    "✅ **Agent Connected**\n\nModel: `{model}`\nMode: {emoji} {mode}"
+)
+_CHEF_STATUS_TEMPLATE: Final[str] = (
+    "## 👨‍🍳 Kitchen Status\n\n"
+    "**Current Mode**: {emoji} {mode}\n"
+    "**Description**: {description}\n"
+    "**Auto-Approve**: {auto}\n"
+    "**Kitchen Bus**: {bus_status}\n\n"
+    "---\n"
+    "*Press Shift+Tab to cycle modes*\n"
+)
+_SESSION_STATUS_TEMPLATE: Final[str] = (
+    "## 📊 Session Status\n\n"
+    "**Mode**: {emoji} {mode}\n"
+    "**Auto-Approve**: {auto}\n"
+    "**Kitchen**: {kitchen}\n"
+)
+_CONFIG_TEMPLATE: Final[str] = (
+    "## ⚙️ Configuration\n\n"
+    "**Mode**: {emoji} {mode}\n"
+    "**Auto-Approve**: {auto}\n\n"
+    "---\n"
+    "*Use the REPL for full configuration options*\n"
+)
+# Shift+Tab notification per mode, built once instead of on every keypress
+_MODE_CHANGED_NOTICES: Final[Mapping[VibeMode, str]] = MappingProxyType({
+    mode: f"{config.emoji} {mode.value.upper()}: {config.description}"
+    for mode, config in MODE_CONFIGS.items()
+})
+
+
+def _build_modes_overview(current: VibeMode) -> str:
+    lines = [
+        "## 🔄 Available Modes",
+        "",
+        "Press **Shift+Tab** to cycle through modes:",
+        "",
+    ]
+    for mode in MODE_CYCLE_ORDER:
+        config = MODE_CONFIGS[mode]
+        marker = "▶" if mode == current else " "
+        lines.append(
+            f"{marker} {config.emoji} **{mode.value.upper()}**: {config.description}"
+        )
+    lines.extend(["", "---", f"Current: **{current.value.upper()}**"])
+    return "\n".join(lines)
+
+
+# /modes overview per current mode; only the marker and footer line vary
+_MODES_OVERVIEWS: Final[Mapping[VibeMode, str]] = MappingProxyType({
+    mode: _build_modes_overview(mode) for mode in VibeMode
+})
+
+# Static system messages
+_KITCHEN_NOT_ACTIVE: Final[str] = (
+    "🔧 **Kitchen Not Active**\n\n"
+    "The TUI is running in standalone mode. Start with `--active` flag:\n"
+    "`uv run vibe --tui --active`\n\n"
+    "*Available commands: `/help`, `/modes`, `/roast`, `/wisdom`*"
+)
+_BASH_USAGE: Final[str] = (
+    "💡 **Usage**: `!<command>`\n\nExample: `!ls -la` or `!git status`"
+)
+_MCP_SETUP_HELP: Final[str] = (
+    "## 🔌 MCP Servers\n\n"
+    "No MCP servers configured.\n\n"
+    "To add an MCP server, edit your `config.toml`:\n\n"
+    "```toml\n"
+    "[[mcp_servers]]\n"
+    'name = "my-server"\n'
+    'transport = "stdio"\n'
+    'command = ["npx", "my-mcp-server"]\n'
+    "```\n\n"
+    "*See docs for HTTP and Streamable HTTP transports.*"
+)
+_LAYOUT_OPTIONS_TEMPLATE: Final[str] = (
+    "## 🖼️ Layout Options\n\n"
+    "Current layout: **{current}**\n\n"
+    "• `/layout chat` — Clean chat-only view\n"
+    "• `/layout kitchen` — Full 3-panel kitchen view"
+)
+_HELP_TEMPLATE: Final[str] = (
+    "## 📋 ChefChat Commands\n\n"
+    "**Navigation**\n"
+    "• `/help` — Show this menu\n"
+    "• `/clear` — Clear the chat\n"
+    "• `/quit` — Exit ChefChat\n\n"
+    "**Modes** *(Shift+Tab to cycle)*\n"
+    "• `/modes` — Show all available modes\n"
+    "• `/status` — Show current session status\n\n"
+    "**Layout** (Current: **{layout}**)\n"
+    "• `/layout chat` — Clean chat-only view\n"
+    "• `/layout kitchen` — Full 3-panel kitchen view\n\n"
+    "**Kitchen Tools**\n"
+    "• `/taste` — Run taste tests (QA)\n"
+    "• `/timer` — Kitchen timer info\n"
+    "• `/log` — Show log file path\n\n"
+    "**Fun Commands**\n"
+    "• `/chef` — Kitchen status\n"
+    "• `/wisdom` — Random chef wisdom\n"
+    "• `/roast` — Get roasted by Gordon Ramsay\n"
+    "• `/fortune` — Developer fortune cookie\n"
+)
+_PLATE_KITCHEN_ONLY: Final[str] = (
+    "📋 `/plate` is only available in **kitchen** layout mode.\n\n"
+    "Use `/layout kitchen` to switch to full kitchen view."
+)
+_EXPEDITOR_UNAVAILABLE: Final[str] = (
+    "⚠️ **Expeditor not available**\n\n"
+    "The kitchen brigade is not fully assembled. Run with `uv run vibe` for full kitchen experience."
+)
+_TIMER_INFO: Final[str] = (
+    "## ⏱️ Kitchen Timer\n\n"
+    "Kitchen timer is coming soon to the TUI!\n"
+    "Use it to track long-running tasks or just to boil an egg perfectly."
+)
+_WISDOMS: Final[tuple[str, ...]] = (
+    '🧑‍🍳 "Mise en place is not just for cooking—it\'s for coding too."',
+    '🔪 "Sharp tools, sharp code. Keep your dependencies updated."',
+    '🍳 "Low and slow wins the race. Don\'t rush your tests."',
+    '🧂 "Season to taste. Iterate based on feedback."',
+    '🍲 "A watched pot never boils. A watched CI never finishes."',
+    '👨‍🍳 "Every chef was once a dishwasher. Keep refactoring."',
+)
+_ROASTS: Final[tuple[str, ...]] = (
+    '🔥 "This code is so raw, it\'s still mooing!"',
+    '🔥 "I\'ve seen better architecture in a sandcastle!"',
+    '🔥 "WHERE IS THE ERROR HANDLING?!"',
+    '🔥 "This function is so long, it needs a GPS!"',
+    '🔥 "You call that a commit message? Pathetic!"',
+    '🔥 "My grandmother writes cleaner Python, and she\'s a COBOL developer!"',
+)
+_FORTUNES: Final[tuple[str, ...]] = (
+    "🥠 Your next merge conflict will resolve itself peacefully.",
+    "🥠 The bug you've been hunting is in the file you refuse to check.",
+    "🥠 A refactor is in your future. Embrace it.",
+    "🥠 Your deployment will succeed on the first try (just kidding).",
+    "🥠 The documentation you need has not been written yet.",
+    "🥠 Someone will appreciate your comment today.",
+)
+_MODEL_INFO: Final[str] = (
+    "## 🤖 Model Information\n\n"
+    "**Status**: Model information not available in TUI mode.\n\n"
+    "Use the **REPL** (`uv run vibe`) for full model configuration.\n"
+)
+_LOG_PATH_INFO: Final[str] = (
+    "## 📝 Kitchen Logs\n\n"
+    f"Logs are stored in:\n`{TUI_PREFS_FILE.parent / 'logs'}`\n\n"
+    "*Check these for details if the soufflé collapses.*"
+)
+
+
+def _is_code_chunk(message: ChefMessage) -> bool:
+    return (
+        message.action == BusAction.STREAM_UPDATE and PayloadKey.CODE in message.payload
+    )
+
+
+def _coalesce_stream_updates(batch: list[ChefMessage]) -> list[ChefMessage]:
+    """Merge runs of adjacent STREAM_UPDATE code chunks into one plate update.
+
+    Consecutive chunks for the same file are concatenated so the plate is
+    re-rendered once per drained batch instead of once per token. Only
+    updates that both carry code are merged; anything else (e.g. the
+    content/full_content updates stations stream) is passed through as is.
+    """
+    code_key = PayloadKey.CODE
+    merged: list[ChefMessage] = []
+    for message in batch:
+        prev = merged[-1] if merged else None
+        if (
+            prev is not None
+            and _is_code_chunk(prev)
+            and _is_code_chunk(message)
+            and prev.payload.get(PayloadKey.FILE_PATH)
+            == message.payload.get(PayloadKey.FILE_PATH)
+        ):
+            code = str(prev.payload[code_key]) + str(message.payload[code_key])
+            # The newest chunk wins for every other key
+            merged[-1] = message.model_copy(
+                update={
+                    "payload": {**prev.payload, **message.payload, code_key.value: code}
+                }
+            )
+            continue
+        merged.append(message)
+    return merged
+
+
+class _TokenBuffer:
+    """Collect streamed tokens and hand them to ``sink`` at most once per frame.
+
+    Every token still reaches the sink within ``STREAM_FLUSH_INTERVAL``, so a
+    stalled stream never leaves text stuck in the buffer.
+    """
+
+    __slots__ = ("_chunks", "_flush_handle", "_sink")
+
+    def __init__(self, sink: Callable[[str], None]) -> None:
+        self._sink = sink
+        self._chunks: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def push(self, token: str) -> None:
+        self._chunks.append(token)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                STREAM_FLUSH_INTERVAL, self.flush
+            )
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._chunks:
+            self._sink("".join(self._chunks))
+            self._chunks.clear()
+
+
+def _format_mcp_server(server: MCPServer) -> str:
+    """Render one configured MCP server as a /mcp bullet line."""
+    name, transport = server.name, server.transport
+    match transport:
+        case "stdio":
+            cmd = server.command
+            if isinstance(cmd, list):
+                cmd = " ".join(cmd[:2])
+            return f"• **{name}** — `stdio` (`{cmd}`)\n"
+        case "http" | "streamable-http":
+            return f"• **{name}** — `{transport}` (`{server.url}`)\n"
+        case _:
+            return f"• **{name}** — `{transport}`\n"
+
+
+def _config_file_mtime() -> int | None:
+    """Modification time of config.toml, or None if it doesn't exist."""
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _payload_text(payload: dict[str, Any], key: str, fallback: str) -> str:
+    """Return the text under ``key``, falling back to ``fallback`` only if empty."""
+    value = payload.get(key) or payload.get(fallback)
+    return str(value) if value else ""
+
+
+# Single characters are stripped in one C-level pass via str.translate;
+# any multi-character sequences fall back to str.replace.
+_SANITIZE_TABLE = str.maketrans({
+    char: replacement
+    for char, replacement in MARKDOWN_SANITIZE_CHARS.items()
+    if len(char) == 1
+})
+_SANITIZE_MULTI_CHAR: tuple[tuple[str, str], ...] = tuple(
+    (chars, replacement)
+    for chars, replacement in MARKDOWN_SANITIZE_CHARS.items()
+    if len(chars) != 1
+)
+
+_ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|[0-?]*[ -/]*[@-~])")
+
 
 def sanitize_markdown_input(text: str) -> str:
     """Sanitize user input for safe markdown rendering."""
     if not text:
         return ""
 
-    sanitized = text
-    for char, replacement in MARKDOWN_SANITIZE_CHARS.items():
-        sanitized = sanitized.replace(char, replacement)
+    sanitized = text.translate(_SANITIZE_TABLE)
+    for chars, replacement in _SANITIZE_MULTI_CHAR:
+        sanitized = sanitized.replace(chars, replacement)
 
-    # Remove ANSI escape sequences
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|[0-?]*[ -/]*[@-~])")
-    sanitized = ansi_escape.sub("", sanitized)
-    sanitized = sanitized.replace("\0", "")
+    # Remove ANSI escape sequences (NUL bytes are already gone via the table)
+    sanitized = _ANSI_ESCAPE_RE.sub("", sanitized)
 
     return sanitized
 
@@ -89,26 +396,42 @@ class AppStateKind(Enum):
     CANCELLING = auto()
 
 
+_PROCESSING_KINDS: Final[frozenset[AppStateKind]] = frozenset({
+    AppStateKind.RUNNING,
+    AppStateKind.CANCELLING,
+})
+
+
 @dataclass(frozen=True, slots=True)
 class AppState:
     kind: AppStateKind
     ticket_id: str | None = None
 
-    @classmethod
-    def idle(cls) -> AppState:
-        return cls(kind=AppStateKind.IDLE, ticket_id=None)
+    @property
+    def is_processing(self) -> bool:
+        return self.kind in _PROCESSING_KINDS
+
+
+@dataclass(slots=True)
+class _MutableAppState:
+    """The app's live state, updated in place on every transition.
 
-    @classmethod
-    def running(cls, ticket_id: str | None) -> AppState:
-        return cls(kind=AppStateKind.RUNNING, ticket_id=ticket_id)
+    Use :meth:`snapshot` when an immutable :class:`AppState` value is needed.
+    """
 
-    @classmethod
-    def cancelling(cls, ticket_id: str | None) -> AppState:
-        return cls(kind=AppStateKind.CANCELLING, ticket_id=ticket_id)
+    kind: AppStateKind = AppStateKind.IDLE
+    ticket_id: str | None = None
 
     @property
     def is_processing(self) -> bool:
-        return self.kind in {AppStateKind.RUNNING, AppStateKind.CANCELLING}
+        return self.kind in _PROCESSING_KINDS
+
+    def set(self, kind: AppStateKind, ticket_id: str | None) -> None:
+        self.kind = kind
+        self.ticket_id = ticket_id
+
+    def snapshot(self) -> AppState:
+        return AppState(kind=self.kind, ticket_id=self.ticket_id)
 
 
 class ChefChatApp(App):
@@ -128,19 +451,28 @@ class ChefChatApp(App):
         Binding("ctrl+m", "cycle_mode", "Cycle Mode", show=False),  # Alternative
     ]
 
-    _STATUS_MAP: ClassVar[dict[str, StationStatus]] = {
-        StatusString.IDLE.value: StationStatus.IDLE,
-        StatusString.PLANNING.value: StationStatus.WORKING,
-        StatusString.COOKING.value: StationStatus.WORKING,
-        StatusString.TESTING.value: StationStatus.WORKING,
-        StatusString.REFACTORING.value: StationStatus.WORKING,
-        "verifying": StationStatus.WORKING,
-        "researching": StationStatus.WORKING,
-        "auditing": StationStatus.WORKING,
-        StatusString.COMPLETE.value: StationStatus.COMPLETE,
-        StatusString.ERROR.value: StationStatus.ERROR,
-        "ready": StationStatus.COMPLETE,
-    }
+    # We map REPL handler names to TUI method names where they differ
+    _REPL_TO_TUI_HANDLER: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "_show_help": "_show_command_palette",
+        "_clear_history": "_handle_clear",
+        "_exit_app": "_handle_quit",
+        "_chef_status": "_show_chef_status",
+        "_chef_wisdom": "_show_wisdom",
+        "_chef_roast": "_show_roast",
+        "_chef_plate": "_handle_plate",
+    })
+
+    # TUI-only commands not in the shared registry: name -> (method, takes arg)
+    _TUI_COMMANDS: ClassVar[Mapping[str, tuple[str, bool]]] = MappingProxyType({
+        "/layout": ("_handle_layout_command", True),
+        "/fortune": ("_show_fortune", False),
+        "/api": ("_handle_api_command", False),
+        "/model": ("_handle_model_command", False),
+        "/mcp": ("_handle_mcp_command", False),
+    })
+
+    # Registry handlers whose signature accepts the command argument string
+    _HANDLERS_TAKING_ARG: ClassVar[frozenset[str]] = frozenset({"_chef_timer"})
 
     def __init__(
         self, layout: TUILayout = TUILayout.CHAT_ONLY, active_mode: bool = False
@@ -148,15 +480,72 @@ class ChefChatApp(App):
         super().__init__()
         self._bus: KitchenBus | None = None
         self._brigade: Brigade | None = None
-        self._state = AppState.idle()
+        self._state = _MutableAppState()
         self._mode_manager = ModeManager(initial_mode=VibeMode.NORMAL)
         self._command_registry = CommandRegistry()
         self._layout = layout
+        self._bus_dispatch = self._build_bus_dispatch()
+        self._bus_inbox: asyncio.Queue[ChefMessage] = asyncio.Queue(
+            maxsize=BUS_INBOX_SIZE
+        )
+        self._bus_drain_task: asyncio.Task[None] | None = None
+        # Strong references to fire-and-forget tasks so they can't be GC'd
+        self._pending_tasks: set[asyncio.Task[None]] = set()
+        # The subset that must finish (bounded) before the kitchen closes
+        self._settle_tasks: set[asyncio.Task[None]] = set()
+        self._shutdown_task: asyncio.Task[None] | None = None
+        self._model_switch_task: asyncio.Task[None] | None = None
+        # The config write in flight, if any; it outlives cancelled callers
+        self._model_save_task: asyncio.Task[None] | None = None
+        self._onboarding_task: asyncio.Task[None] | None = None
+        self._unsaved_model_alias: str | None = None
+        self._restart_layout: str | None = None
 
         # Active Mode
         self._active_mode = active_mode
         self._agent: Agent | None = None
         self._config: VibeConfig | None = None
+        self._config_lock = asyncio.Lock()
+        self._config_mtime: int | None = None
+
+    # Widgets are composed once per app run (a layout switch restarts the app),
+    # so their lookups are resolved on first use and reused afterwards.
+    @cached_property
+    def _ticket_rail(self) -> TicketRail:
+        return self.query_one("#ticket-rail", TicketRail)
+
+    @cached_property
+    def _plate(self) -> ThePlate:
+        return self.query_one("#the-plate", ThePlate)
+
+    @cached_property
+    def _the_pass(self) -> ThePass:
+        return self.query_one("#the-pass", ThePass)
+
+    @cached_property
+    def _loader(self) -> WhiskLoader:
+        return self.query_one(WhiskLoader)
+
+    @cached_property
+    def _command_input(self) -> CommandInput:
+        return self.query_one("#command-input", CommandInput)
+
+    @cached_property
+    def _footer(self) -> KitchenFooter:
+        return self.query_one("#kitchen-footer", KitchenFooter)
+
+    @cached_property
+    def _bash_executor(self) -> SecureCommandExecutor:
+        # Imported on first `!` command only; the executor is stateless apart
+        # from its workdir, so one instance serves every command.
+        from chefchat.core.tools.executor import SecureCommandExecutor
+
+        return SecureCommandExecutor(Path.cwd())
+
+    @property
+    def state(self) -> AppState:
+        """Immutable snapshot of the current processing state."""
+        return self._state.snapshot()
 
     @property
     def bus(self) -> KitchenBus:
@@ -164,12 +553,27 @@ class ChefChatApp(App):
             raise RuntimeError("Kitchen bus not initialized")
         return self._bus
 
+    def _spawn(
+        self, coro: Coroutine[Any, Any, None], *, settle: bool = False
+    ) -> asyncio.Task[None]:
+        """Start a background task and keep it referenced until it finishes.
+
+        With ``settle=True`` shutdown also waits (bounded) for the task.
+        """
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        if settle:
+            self._settle_tasks.add(task)
+            task.add_done_callback(self._settle_tasks.discard)
+        return task
+
     async def _initialize_agent(self) -> None:
         """Initialize the core Agent for active mode."""
         try:
             # Ensure environment variables are loaded from .env
-            load_api_keys_from_env()
-            self._config = VibeConfig.load()
+            await asyncio.to_thread(_load_api_keys_once)
+            vibe_config = await self._ensure_config()
         except MissingAPIKeyError:
             # Push onboarding screen if key is missing
             await self.push_screen(OnboardingScreen(), self._on_onboarding_complete)
@@ -179,7 +583,7 @@ class ChefChatApp(App):
             return
 
         self._agent = Agent(
-            config=self._config,
+            config=vibe_config,
             auto_approve=self._mode_manager.auto_approve,
             enable_streaming=True,
             mode_manager=self._mode_manager,
@@ -189,10 +593,12 @@ class ChefChatApp(App):
         # Notify user
         mode = self._mode_manager.current_mode
         config = MODE_CONFIGS[mode]
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            f"✅ **Agent Connected**\n\n"
-            f"Model: `{self._config.active_model}`\n"
-            f"Mode: {config.emoji} {mode.value.upper()}"
+        self._ticket_rail.add_system_message(
+            _AGENT_CONNECTED_TEMPLATE.format(
+                model=vibe_config.active_model,
+                emoji=config.emoji,
+                mode=mode.value.upper(),
+            )
         )
 
     def _on_onboarding_complete(self, provider: str | None) -> None:
@@ -205,26 +611,41 @@ class ChefChatApp(App):
             self.notify("Setup incomplete. Chat will be disabled.", severity="warning")
             return
 
+        if self._onboarding_task and not self._onboarding_task.done():
+            # A newer onboarding supersedes an in-flight agent re-init
+            self._onboarding_task.cancel()
+        self._onboarding_task = self._spawn(self._finish_onboarding(provider))
+
+    async def _finish_onboarding(self, provider: str) -> None:
+        """Align the active model with the new provider and start the agent."""
         # We must ensure the active model matches the configured provider
         # to avoid immediate crash on re-init.
         try:
             # Load config (should pass now that key is in env)
-            load_api_keys_from_env()
-            config = VibeConfig.load()
+            await asyncio.to_thread(load_api_keys_from_env)
+            config = await asyncio.to_thread(VibeConfig.load)
+            # Cache the fresh load so _initialize_agent() builds from it
+            self._config = config
+            self._config_mtime = _config_file_mtime()
 
             current_model = config.get_active_model()
-            if current_model.provider != provider:
-                # Switch to first model for this provider
-                for model in config.models:
-                    if model.provider == provider:
-                        self.notify(f"Switching active model to {model.alias}...")
-                        config.active_model = model.alias
-                        VibeConfig.save_updates({"active_model": model.alias})
-                        break
+            # Switch to first model for this provider
+            if current_model.provider != provider and (
+                model := next(
+                    (m for m in config.models if m.provider == provider), None
+                )
+            ):
+                self.notify(f"Switching active model to {model.alias}...")
+                config.active_model = model.alias
+                await asyncio.to_thread(
+                    VibeConfig.save_updates, {"active_model": model.alias}
+                )
+                # The cached config already carries the new alias
+                self._config_mtime = _config_file_mtime()
         except Exception as e:
             logger.warning(f"Error adjusting model after onboarding: {e}")
 
-        asyncio.create_task(self._initialize_agent())
+        await self._initialize_agent()
 
     async def _tool_approval_callback(
         self, tool_name: str, tool_args: dict | str
@@ -232,18 +653,23 @@ class ChefChatApp(App):
         """Handle tool approval requests via modal."""
         # We need to wait for the user response, so we use a future
         loop = asyncio.get_running_loop()
-        future = loop.create_future()
+        future: asyncio.Future[tuple[str, str | None]] = loop.create_future()
 
-        def on_screen_result(result: tuple[str, str | None]) -> None:
+        def resolve(result: tuple[str, str | None]) -> None:
             if not future.done():
                 future.set_result(result)
 
-        # Schedule screen push on main thread
-        self.call_from_thread(
-            lambda: self.push_screen(
-                ToolApprovalScreen(tool_name, tool_args), on_screen_result
-            )
-        )
+        screen = ToolApprovalScreen(tool_name, tool_args)
+        app_loop = self._loop or loop
+        if app_loop is loop:
+            # The agent loop is an async worker on the app loop: push directly
+            self.push_screen(screen, resolve)
+        else:
+            # Called from another loop/thread: hop over and back thread-safely
+            def on_screen_result(result: tuple[str, str | None]) -> None:
+                loop.call_soon_threadsafe(resolve, result)
+
+            app_loop.call_soon_threadsafe(self.push_screen, screen, on_screen_result)
 
         return await future
 
@@ -279,64 +705,99 @@ class ChefChatApp(App):
                 # Standalone mode: Just the bus for local messaging
                 self._bus = KitchenBus()
                 await self._bus.start()
-                self._bus.subscribe("tui", self._handle_bus_message)
+                self._bus.subscribe("tui", self._enqueue_bus_message)
+
+            self._bus_drain_task = asyncio.create_task(self._drain_bus_messages())
 
-            ticket_rail = self.query_one("#ticket-rail", TicketRail)
+            ticket_rail = self._ticket_rail
             mode = self._mode_manager.current_mode
             config = MODE_CONFIGS[mode]
 
-            active_status = (
-                "🟢 **Brigade Active**" if self._active_mode else "💤 *Standalone Mode*"
-            )
             ticket_rail.add_system_message(
-                f"🍽️ **Welcome to ChefChat!**\n\n"
-                f"The kitchen is ready, Chef. What would you like to cook today?\n\n"
-                f"*Current Mode: {config.emoji} {mode.value.upper()}*\n\n"
-                f"{active_status}\n\n"
-                f"*Commands: `/help` for menu, `/modes` to see modes, `Shift+Tab` to cycle*"
+                _WELCOME_TEMPLATE.format(
+                    emoji=config.emoji,
+                    mode=mode.value.upper(),
+                    status=_BRIGADE_ACTIVE if self._active_mode else _STANDALONE,
+                )
             )
 
-            self.query_one("#command-input", CommandInput).focus()
+            self._command_input.focus()
 
         except Exception as e:
             logger.exception("Error in on_mount: %s", e)
-            print(f"❌ Fatal Error in on_mount: {e}", file=sys.stderr)
-            traceback.print_exc()
             self.notify(f"Kitchen Error: {e}", severity="error")
 
     async def on_unmount(self) -> None:
         await self._shutdown()
 
+    def _enqueue_bus_message(self, message: ChefMessage) -> None:
+        """Bus callback: hand the message to the drain task without awaiting."""
+        try:
+            self._bus_inbox.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(
+                "TUI inbox full. Dropping message %s from %s",
+                message.id,
+                message.sender,
+            )
+
+    async def _drain_bus_messages(self) -> None:
+        """Process queued bus messages, draining whatever piled up in one go."""
+        inbox = self._bus_inbox
+        while True:
+            batch = [await inbox.get()]
+            while not inbox.empty():
+                batch.append(inbox.get_nowait())
+            try:
+                messages = _coalesce_stream_updates(batch)
+            except Exception as exc:
+                # Never let one bad payload kill the drain task; deliver as-is
+                logger.exception("Error coalescing bus messages: %s", exc)
+                messages = batch
+            for message in messages:
+                await self._handle_bus_message(message)
+
     async def _handle_bus_message(self, message: ChefMessage) -> None:
         """Handle incoming messages from the bus."""
         try:
-            action = str(message.action).upper()
-            match action:
-                case BusAction.STATUS_UPDATE.value:
-                    await self._update_station_status(message.payload)
-                case BusAction.LOG_MESSAGE.value:
-                    await self._add_log_message(message.payload)
-                case BusAction.PLATE_CODE.value:
-                    await self._plate_code(message.payload)
-                case BusAction.STREAM_UPDATE.value:
-                    await self._plate_code(message.payload, append=True)
-                case BusAction.TERMINAL_LOG.value:
-                    await self._add_terminal_log(message.payload)
-                case BusAction.PLAN.value:
-                    await self._add_plan(message.payload)
-                case BusAction.TICKET_DONE.value:
-                    await self._on_ticket_done(message.payload)
+            # Stations send canonical upper-case actions; only a miss pays for
+            # normalizing a non-canonical spelling.
+            action = message.action
+            dispatch = self._bus_dispatch
+            if handler := dispatch.get(action) or dispatch.get(action.upper()):
+                await handler(message.payload)
         except Exception as exc:
             logger.exception("Error handling bus message: %s", exc)
 
+    def _build_bus_dispatch(self) -> dict[str, BusHandler]:
+        """Build the action -> handler table specialized for the current layout.
+
+        The layout never changes for the lifetime of the app, so panels that
+        don't exist in CHAT_ONLY are left out of the table entirely instead of
+        being branched on for every bus event.
+        """
+        dispatch: dict[str, BusHandler] = {
+            BusAction.LOG_MESSAGE.value: self._add_log_message,
+            BusAction.PLAN.value: self._add_plan,
+            BusAction.TICKET_DONE.value: self._on_ticket_done,
+        }
+        if self._layout == TUILayout.FULL_KITCHEN:
+            dispatch |= {
+                BusAction.STATUS_UPDATE.value: self._update_station_status,
+                BusAction.PLATE_CODE.value: self._plate_code,
+                BusAction.STREAM_UPDATE.value: partial(self._plate_code, append=True),
+                BusAction.TERMINAL_LOG.value: self._add_terminal_log,
+            }
+        return dispatch
+
     def _enter_running(self, ticket_id: str | None) -> None:
-        self._state = AppState.running(ticket_id)
+        self._state.set(AppStateKind.RUNNING, ticket_id)
 
     def _enter_cancelling(self) -> None:
-        self._state = AppState.cancelling(self._state.ticket_id)
+        self._state.kind = AppStateKind.CANCELLING
 
     def _enter_idle(self) -> None:
-        self._state = AppState.idle()
+        self._state.set(AppStateKind.IDLE, None)
 
     async def _on_ticket_done(self, payload: dict) -> None:
         """Finalize the current ticket lifecycle.
@@ -352,30 +813,25 @@ class ChefChatApp(App):
         self._enter_idle()
 
         try:
-            self.query_one(WhiskLoader).stop()
-        except Exception:
-            pass
-
-        try:
-            self.query_one("#ticket-rail", TicketRail).finish_streaming_message()
-        except Exception:
-            pass
+            self._loader.stop()
+            self._ticket_rail.finish_streaming_message()
+        except Exception as exc:
+            logger.exception("Error finalizing ticket: %s", exc)
 
     async def _update_station_status(self, payload: dict) -> None:
-        # ThePass only exists in FULL_KITCHEN layout
-        if self._layout != TUILayout.FULL_KITCHEN:
-            return
-
+        # Only routed in FULL_KITCHEN (see _build_bus_dispatch), so ThePass exists
         station_id = payload.get(PayloadKey.STATION, "")
         if not station_id:
             return
 
-        status_raw = str(payload.get(PayloadKey.STATUS, "")).lower()
-        status = self._STATUS_MAP.get(status_raw, StationStatus.IDLE)
+        # Stations send lower-case status strings; only a miss pays for .lower()
+        status_raw = payload.get(PayloadKey.STATUS, "")
+        if (status := _status_map_get(status_raw)) is None:
+            status = _status_map_get(str(status_raw).lower(), StationStatus.IDLE)
         progress = float(payload.get(PayloadKey.PROGRESS, 0.0) or 0.0)
         message = str(payload.get(PayloadKey.MESSAGE, "")) or status.name.capitalize()
 
-        station_board = self.query_one("#the-pass", ThePass)
+        station_board = self._the_pass
         station_board.update_station(station_id, status, progress, message)
 
         # Failsafe: if we are processing and a station enters ERROR, force stop.
@@ -385,51 +841,39 @@ class ChefChatApp(App):
             })
 
     async def _add_log_message(self, payload: dict) -> None:
-        content = str(
-            payload.get(PayloadKey.CONTENT, "") or payload.get(PayloadKey.MESSAGE, "")
-        )
+        content = _payload_text(payload, PayloadKey.CONTENT, PayloadKey.MESSAGE)
         if not content:
             return
 
         # Log to ticket rail
-        self.query_one("#ticket-rail", TicketRail).add_assistant_message(content)
+        self._ticket_rail.add_assistant_message(content)
         # Also log to Plate log (only in FULL_KITCHEN layout)
         if self._layout == TUILayout.FULL_KITCHEN:
-            self.query_one("#the-plate", ThePlate).log_message(content)
+            self._plate.log_message(content)
 
     async def _plate_code(self, payload: dict, *, append: bool = False) -> None:
-        # ThePlate only exists in FULL_KITCHEN layout
-        if self._layout != TUILayout.FULL_KITCHEN:
-            return
-
-        code = str(payload.get(PayloadKey.CODE, ""))
-        if not code:
+        # Only routed in FULL_KITCHEN (see _build_bus_dispatch), so ThePlate exists
+        get = payload.get  # STREAM_UPDATE lands here once per drained chunk
+        if not (code := get(PayloadKey.CODE)):
             return
 
-        language = str(payload.get(PayloadKey.LANGUAGE, "python")) or "python"
-        file_path = payload.get(PayloadKey.FILE_PATH)
-        plate = self.query_one("#the-plate", ThePlate)
-        plate.plate_code(code, language=language, file_path=file_path, append=append)
+        self._plate.plate_code(
+            str(code),
+            language=str(get(PayloadKey.LANGUAGE) or "python"),
+            file_path=get(PayloadKey.FILE_PATH),
+            append=append,
+        )
 
     async def _add_terminal_log(self, payload: dict) -> None:
-        # ThePlate only exists in FULL_KITCHEN layout
-        if self._layout != TUILayout.FULL_KITCHEN:
-            return
-
-        message = str(
-            payload.get(PayloadKey.MESSAGE, "") or payload.get(PayloadKey.CONTENT, "")
-        )
+        # Only routed in FULL_KITCHEN (see _build_bus_dispatch), so ThePlate exists
+        message = _payload_text(payload, PayloadKey.MESSAGE, PayloadKey.CONTENT)
         if message:
-            self.query_one("#the-plate", ThePlate).log_message(message)
+            self._plate.log_message(message)
 
     async def _add_plan(self, payload: dict) -> None:
-        task = str(
-            payload.get(PayloadKey.TASK, "") or payload.get(PayloadKey.CONTENT, "")
-        )
+        task = _payload_text(payload, PayloadKey.TASK, PayloadKey.CONTENT)
         if task:
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
-                f"🗺️ Plan updated: {task}"
-            )
+            self._ticket_rail.add_system_message(f"🗺️ Plan updated: {task}")
 
     @on(Input.Submitted)
     async def handle_input(self, event: Input.Submitted) -> None:
@@ -442,15 +886,22 @@ class ChefChatApp(App):
             if not val:
                 return
 
+            # Slash commands are matched against known names and never render
+            # their raw text (unknown names are sanitized where echoed), so
+            # only the other inputs need sanitizing up front.
+            if (prefix := val[0]) == "/":
+                event.input.value = ""
+                await self._handle_command(val)
+                return
+
             user_input = sanitize_markdown_input(val)
             if not user_input.strip():
                 return
 
             event.input.value = ""
 
-            if user_input.startswith("/"):
-                await self._handle_command(user_input)
-            elif user_input.startswith("!"):
+            # Triage uses the raw first character, as typed
+            if prefix == "!":
                 await self._handle_bash_command(user_input)
             else:
                 await self._submit_ticket(user_input)
@@ -464,25 +915,29 @@ class ChefChatApp(App):
         if not self._agent:
             return
 
-        ticket_rail = self.query_one("#ticket-rail", TicketRail)
+        ticket_rail = self._ticket_rail
         # ThePlate only exists in FULL_KITCHEN layout
         plate = None
         if self._layout == TUILayout.FULL_KITCHEN:
-            plate = self.query_one("#the-plate", ThePlate)
-        loader = self.query_one(WhiskLoader)
+            plate = self._plate
+        loader = self._loader
 
         # UI Updates directly (we are on main loop)
         loader.start("Thinking...")
         ticket_rail.start_streaming_message()
         self._enter_running(None)
+        tokens = _TokenBuffer(ticket_rail.stream_token)
 
         try:
             async for event in self._agent.act(request):
                 if isinstance(event, AssistantEvent):
                     if event.content:
-                        ticket_rail.stream_token(event.content)
+                        tokens.push(event.content)
+                    continue
 
-                elif isinstance(event, ToolCallEvent):
+                # Keep the reply text ahead of whatever this event logs
+                tokens.flush()
+                if isinstance(event, ToolCallEvent):
                     if plate:
                         plate.log_message(
                             f"[bold blue]🛠️ Calling Tool:[/] {event.tool_name}\n"
@@ -508,67 +963,62 @@ class ChefChatApp(App):
             self.notify(f"Agent Error: {e}", severity="error")
             if plate:
                 plate.log_message(f"[bold red]Error:[/] {e}\n")
-            traceback.print_exc()  # Print stack trace to stderr
+            logger.exception("Agent loop error")
         finally:
+            tokens.flush()
             ticket_rail.finish_streaming_message()
             loader.stop()
             self._enter_idle()
 
+    def _build_new_ticket_msg(self, ticket_id: str, request: str) -> ChefMessage:
+        """Build the NEW_TICKET message sent to the Sous Chef."""
+        return ChefMessage(
+            sender="tui",
+            recipient="sous_chef",
+            action=BusAction.NEW_TICKET.value,
+            payload={PayloadKey.TICKET_ID: ticket_id, PayloadKey.REQUEST: request},
+            priority=MessagePriority.HIGH,
+        )
+
+    def _build_taste_test_msg(self, ticket_id: str) -> ChefMessage:
+        """Build the TASTE_TEST message sent to the Expeditor."""
+        return ChefMessage(
+            sender="tui",
+            recipient="expeditor",
+            action=_TASTE_TEST_ACTION,
+            # Default to running pytest and ruff on current directory
+            payload={
+                PayloadKey.TICKET_ID: ticket_id,
+                "tests": _TASTE_TESTS,
+                "path": ".",
+            },
+            priority=MessagePriority.HIGH,
+        )
+
     async def _submit_ticket(self, request: str) -> None:
         """Submit a new ticket to the kitchen via the bus."""
         # Show user message in UI immediately
-        self.query_one("#ticket-rail", TicketRail).add_user_message(request)
-
-        # ACTIVE MODE: Use Brigade via Bus
-        if self._active_mode and self._brigade:
-            if not self._bus:
-                self.notify("Kitchen bus not ready!", severity="error")
-                return
-
-            ticket_id = str(uuid4())[:8]
-            message = ChefMessage(
-                sender="tui",
-                recipient="sous_chef",
-                action=BusAction.NEW_TICKET.value,
-                payload={PayloadKey.TICKET_ID: ticket_id, PayloadKey.REQUEST: request},
-                priority=MessagePriority.HIGH,
-            )
-
-            # Start the loader
-            self.query_one(WhiskLoader).start("Cooking...")
-            self._enter_running(ticket_id)
-
-            await self._bus.publish(message)
-            return
+        ticket_rail = self._ticket_rail
+        ticket_rail.add_user_message(request)
 
         # STANDALONE MODE: No brigade connected
         if not self._brigade:
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
-                "🔧 **Kitchen Not Active**\n\n"
-                "The TUI is running in standalone mode. Start with `--active` flag:\n"
-                "`uv run vibe --tui --active`\n\n"
-                "*Available commands: `/help`, `/modes`, `/roast`, `/wisdom`*"
-            )
+            ticket_rail.add_system_message(_KITCHEN_NOT_ACTIVE)
             return
 
         if not self._bus:
             self.notify("Kitchen bus not ready!", severity="error")
             return
 
-        ticket_id = str(uuid4())[:8]
-        message = ChefMessage(
-            sender="tui",
-            recipient="sous_chef",
-            action=BusAction.NEW_TICKET.value,
-            payload={PayloadKey.TICKET_ID: ticket_id, PayloadKey.REQUEST: request},
-            priority=MessagePriority.HIGH,
-        )
+        ticket_id = secrets.token_hex(4)
 
         # Start the loader
-        self.query_one(WhiskLoader).start("Processing ticket...")
+        self._loader.start(
+            "Cooking..." if self._active_mode else "Processing ticket..."
+        )
         self._enter_running(ticket_id)
 
-        await self._bus.publish(message)
+        await self._bus.publish(self._build_new_ticket_msg(ticket_id, request))
 
     async def _handle_bash_command(self, command: str) -> None:
         """Execute bash command from TUI.
@@ -581,24 +1031,18 @@ class ChefChatApp(App):
 
         cmd = command[1:].strip()
         if not cmd:
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
-                "💡 **Usage**: `!<command>`\n\nExample: `!ls -la` or `!git status`"
-            )
+            self._ticket_rail.add_system_message(_BASH_USAGE)
             return
 
-        ticket_rail = self.query_one("#ticket-rail", TicketRail)
+        ticket_rail = self._ticket_rail
         ticket_rail.add_user_message(f"`!{cmd}`")
 
         # Start loader
-        loader = self.query_one(WhiskLoader)
+        loader = self._loader
         loader.start(f"Running: {cmd[:30]}...")
 
         try:
-            from pathlib import Path
-
-            from chefchat.core.tools.executor import SecureCommandExecutor
-
-            executor = SecureCommandExecutor(Path.cwd())
+            executor = self._bash_executor
             stdout, stderr, returncode = await executor.execute(cmd, timeout=30)
 
             # Format output
@@ -631,203 +1075,168 @@ class ChefChatApp(App):
         if not command.startswith("/"):
             return
 
-        parts = command.split(maxsplit=1)
-        name = parts[0].lower()
-        arg = parts[1].strip() if len(parts) > 1 else ""
+        # Input is stripped upstream; partition avoids a list for bare commands
+        name, _, arg = command.partition(" ")
+        if not name.islower():
+            name = name.lower()
+        arg = arg.strip()
 
-        # Use shared CommandRegistry to find the command
-        cmd_obj = self._command_registry.find_command(name)
+        # Use shared CommandRegistry; name is already normalized above
+        cmd_obj = self._command_registry.get_command(name)
 
         if cmd_obj:
             # Dispatch to appropriate method
-            # We map REPL handler names to TUI method names where they differ
-            handler_map = {
-                "_show_help": "_show_command_palette",
-                "_show_status": "_show_status",
-                "_show_config": "_show_config",
-                "_reload_config": "_reload_config",
-                "_clear_history": "_handle_clear",
-                "_show_log_path": "_show_log_path",
-                "_compact_history": "_compact_history",
-                "_exit_app": "_handle_quit",
-                "_chef_status": "_show_chef_status",
-                "_chef_wisdom": "_show_wisdom",
-                "_show_modes": "_show_modes",
-                "_chef_roast": "_show_roast",
-                "_chef_plate": "_handle_plate",
-                "_chef_taste": "_chef_taste",
-                "_chef_timer": "_chef_timer",
-            }
-
-            handler_name = handler_map.get(cmd_obj.handler, cmd_obj.handler)
+            handler_name = self._REPL_TO_TUI_HANDLER.get(
+                cmd_obj.handler, cmd_obj.handler
+            )
 
             if hasattr(self, handler_name):
                 handler = getattr(self, handler_name)
-                # Check execution signature - some methods take arg, some don't
-                import inspect
-
-                sig = inspect.signature(handler)
-                if len(sig.parameters) > 0:
+                # Some handlers take the argument string, most don't
+                if handler_name in self._HANDLERS_TAKING_ARG:
                     await handler(arg)
                 else:
                     await handler()
                 return
 
         # Fallback for TUI-specific commands not in registry
-        if name in {"/layout", "/fortune", "/api", "/model", "/mcp"}:
-            if name == "/layout":
-                await self._handle_layout_command(arg)
-            elif name == "/fortune":
-                await self._show_fortune()
-            elif name == "/api":
-                await self._handle_api_command()
-            elif name == "/model":
-                await self._handle_model_command()
-            elif name == "/mcp":
-                await self._handle_mcp_command()
+        if entry := self._TUI_COMMANDS.get(name):
+            method_name, takes_arg = entry
+            handler = getattr(self, method_name)
+            await (handler(arg) if takes_arg else handler())
             return
 
         # Unknown command
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            f"❓ Unknown command: `{name}`\n\nType `/help` to see available commands."
+        self._ticket_rail.add_system_message(
+            f"❓ Unknown command: `{sanitize_markdown_input(name)}`\n\n"
+            "Type `/help` to see available commands."
         )
 
     async def _handle_api_command(self) -> None:
         """Show API key onboarding screen."""
         await self.push_screen(OnboardingScreen(), self._on_onboarding_complete)
 
+    def _config_is_stale(self) -> bool:
+        # Only configs loaded from disk here carry an mtime to compare against
+        return (
+            self._config_mtime is not None
+            and _config_file_mtime() != self._config_mtime
+        )
+
+    async def _ensure_config(self) -> VibeConfig:
+        """Return the cached config, reloading only if config.toml changed on disk.
+
+        Loading happens off the event loop and at most once under concurrent calls.
+        """
+        if self._config and not self._config_is_stale():
+            return self._config
+        async with self._config_lock:
+            if not self._config or self._config_is_stale():
+                self._config = await asyncio.to_thread(VibeConfig.load)
+                # Stat after loading: VibeConfig.load() may migrate the file
+                self._config_mtime = _config_file_mtime()
+            return self._config
+
     async def _handle_model_command(self) -> None:
         """Show model selection screen."""
-        if not self._config:
-            self._config = VibeConfig.load()
+        config = await self._ensure_config()
 
         def on_model_selected(model_alias: str | None) -> None:
-            if model_alias and self._config:
-                try:
-                    # Update config active model
-                    self._config.active_model = model_alias
+            if not model_alias or not self._config:
+                return
+            if model_alias == self._config.active_model:
+                return
+            # Update config active model; persisting happens off the loop
+            self._config.active_model = model_alias
+            self._unsaved_model_alias = model_alias
+            if self._model_switch_task and not self._model_switch_task.done():
+                # A newer selection supersedes the debounce or agent re-init;
+                # a save already writing is shielded and finishes first
+                self._model_switch_task.cancel()
+            self._model_switch_task = self._spawn(
+                self._persist_active_model(model_alias)
+            )
+            self.notify(f"Switched to model: {model_alias}")
+
+        await self.push_screen(ModelSelectionScreen(config), on_model_selected)
+
+    async def _persist_active_model(self, model_alias: str) -> None:
+        """Write the active model to disk, then re-initialize the agent.
+
+        The write is debounced so rapid successive selections cancel each other
+        and only the last one reaches the disk.
+        """
+        await asyncio.sleep(MODEL_SAVE_DEBOUNCE)
+        try:
+            await self._flush_active_model()
+        except Exception as e:
+            self.notify(f"Failed to switch model: {e}", severity="error")
+            return
 
-                    # Persist change
-                    VibeConfig.save_updates({"active_model": model_alias})
+        # Re-initialize agent if active (it reloads the config we just saved)
+        if self._active_mode:
+            await self._initialize_agent()
 
-                    # Re-initialize agent if active
-                    if self._active_mode:
-                        asyncio.create_task(self._initialize_agent())
+    async def _flush_active_model(self) -> None:
+        """Save the pending active-model selection, if any.
 
-                    self.notify(f"Switched to model: {model_alias}")
-                except Exception as e:
-                    self.notify(f"Failed to switch model: {e}", severity="error")
+        Cancelling a caller cannot stop a save already running in a worker
+        thread, so writes run as their own task and never overlap: a flush
+        first waits out any save in flight, then writes what is still unsaved.
+        """
+        while (save := self._model_save_task) is not None and not save.done():
+            # asyncio.wait neither cancels the save nor re-raises its error
+            await asyncio.wait({save})
+        if (model_alias := self._unsaved_model_alias) is None:
+            return
+        self._model_save_task = save = asyncio.create_task(
+            self._save_active_model(model_alias)
+        )
+        await asyncio.shield(save)
 
-        await self.push_screen(ModelSelectionScreen(self._config), on_model_selected)
+    async def _save_active_model(self, model_alias: str) -> None:
+        await asyncio.to_thread(VibeConfig.save_updates, {"active_model": model_alias})
+        if self._unsaved_model_alias == model_alias:
+            self._unsaved_model_alias = None
 
     async def _handle_mcp_command(self) -> None:
         """Show MCP server status and available tools."""
-        if not self._config:
-            self._config = VibeConfig.load()
+        config = await self._ensure_config()
 
-        ticket_rail = self.query_one("#ticket-rail", TicketRail)
-        mcp_servers = self._config.mcp_servers
+        ticket_rail = self._ticket_rail
+        mcp_servers = config.mcp_servers
 
         if not mcp_servers:
-            ticket_rail.add_system_message(
-                "## 🔌 MCP Servers\n\n"
-                "No MCP servers configured.\n\n"
-                "To add an MCP server, edit your `config.toml`:\n\n"
-                "```toml\n"
-                "[[mcp_servers]]\n"
-                'name = "my-server"\n'
-                'transport = "stdio"\n'
-                'command = ["npx", "my-mcp-server"]\n'
-                "```\n\n"
-                "*See docs for HTTP and Streamable HTTP transports.*"
-            )
+            ticket_rail.add_system_message(_MCP_SETUP_HELP)
             return
 
-        # Build status display
-        lines = [
-            "## 🔌 MCP Servers",
-            "",
-            f"**{len(mcp_servers)}** server(s) configured:",
-            "",
-        ]
-
-        for server in mcp_servers:
-            transport = getattr(server, "transport", "unknown")
-            name = getattr(server, "name", "unnamed")
-
-            match transport:
-                case "stdio":
-                    cmd = getattr(server, "command", "")
-                    if isinstance(cmd, list):
-                        cmd = " ".join(cmd[:2])
-                    lines.append(f"• **{name}** — `stdio` (`{cmd}`)")
-                case "http" | "streamable-http":
-                    url = getattr(server, "url", "")
-                    lines.append(f"• **{name}** — `{transport}` (`{url}`)")
-                case _:
-                    lines.append(f"• **{name}** — `{transport}`")
-
-        lines.extend(["", "---", "*MCP tools are loaded when the agent starts.*"])
-
-        ticket_rail.add_system_message("\n".join(lines))
+        ticket_rail.add_system_message(
+            f"## 🔌 MCP Servers\n\n**{len(mcp_servers)}** server(s) configured:\n\n"
+            + "".join([_format_mcp_server(server) for server in mcp_servers])
+            + "\n---\n*MCP tools are loaded when the agent starts.*"
+        )
 
     async def _show_command_palette(self) -> None:
         """Show help directly in chat instead of separate palette."""
-        layout_info = f"Current: **{self._layout.value}**"
-        help_text = f"""## 📋 ChefChat Commands
-
-**Navigation**
-• `/help` — Show this menu
-• `/clear` — Clear the chat
-• `/quit` — Exit ChefChat
-
-**Modes** *(Shift+Tab to cycle)*
-• `/modes` — Show all available modes
-• `/status` — Show current session status
-
-**Layout** ({layout_info})
-• `/layout chat` — Clean chat-only view
-• `/layout kitchen` — Full 3-panel kitchen view
-
-**Kitchen Tools**
-• `/taste` — Run taste tests (QA)
-• `/timer` — Kitchen timer info
-• `/log` — Show log file path
-
-**Fun Commands**
-• `/chef` — Kitchen status
-• `/wisdom` — Random chef wisdom
-• `/roast` — Get roasted by Gordon Ramsay
-• `/fortune` — Developer fortune cookie
-"""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(help_text)
+        self._ticket_rail.add_system_message(
+            _HELP_TEMPLATE.format(layout=self._layout.value)
+        )
 
     async def _handle_layout_command(self, arg: str) -> None:
         """Handle layout switching command."""
-        arg = arg.lower().strip()
-
-        if arg == "chat":
-            if self._layout == TUILayout.CHAT_ONLY:
-                self.query_one("#ticket-rail", TicketRail).add_system_message(
-                    "Already in **chat** layout mode."
+        match arg.lower().strip():
+            case TUILayout.CHAT_ONLY | TUILayout.FULL_KITCHEN as target if (
+                target == self._layout
+            ):
+                self._ticket_rail.add_system_message(
+                    f"Already in **{target}** layout mode."
                 )
-            else:
-                await self._confirm_layout_switch("chat")
-        elif arg == "kitchen":
-            if self._layout == TUILayout.FULL_KITCHEN:
-                self.query_one("#ticket-rail", TicketRail).add_system_message(
-                    "Already in **kitchen** layout mode."
+            case TUILayout.CHAT_ONLY | TUILayout.FULL_KITCHEN as target:
+                await self._confirm_layout_switch(target)
+            case _:
+                self._ticket_rail.add_system_message(
+                    _LAYOUT_OPTIONS_TEMPLATE.format(current=self._layout.value)
                 )
-            else:
-                await self._confirm_layout_switch("kitchen")
-        else:
-            current = self._layout.value
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
-                f"## 🖼️ Layout Options\n\n"
-                f"Current layout: **{current}**\n\n"
-                f"• `/layout chat` — Clean chat-only view\n"
-                f"• `/layout kitchen` — Full 3-panel kitchen view"
-            )
 
     async def _handle_quit(self) -> None:
         """Handle quit command."""
@@ -837,12 +1246,9 @@ class ChefChatApp(App):
     async def _handle_plate(self) -> None:
         """Handle plate command wrapper."""
         if self._layout == TUILayout.FULL_KITCHEN:
-            self.query_one("#the-plate", ThePlate).show_current_plate()
+            self._plate.show_current_plate()
         else:
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
-                "📋 `/plate` is only available in **kitchen** layout mode.\n\n"
-                "Use `/layout kitchen` to switch to full kitchen view."
-            )
+            self._ticket_rail.add_system_message(_PLATE_KITCHEN_ONLY)
 
     async def _confirm_layout_switch(self, new_layout: str) -> None:
         """Show confirmation dialog for layout switch."""
@@ -851,190 +1257,115 @@ class ChefChatApp(App):
             if confirmed:
                 # Save preference and restart
                 save_tui_preference("layout", new_layout)
+                # run() relaunches with this directly instead of re-reading prefs
+                self._restart_layout = new_layout
 
                 # Show message and restart
                 self.notify(f"Restarting with {new_layout} layout...", timeout=1)
-                self.set_timer(0.5, lambda: self.exit(result="RESTART"))
-            else:
-                self.query_one("#ticket-rail", TicketRail).add_system_message(
-                    "Layout switch cancelled."
+                self.set_timer(
+                    LAYOUT_RESTART_DELAY, lambda: self.exit(result="RESTART")
                 )
+            else:
+                self._ticket_rail.add_system_message("Layout switch cancelled.")
 
         self.push_screen(ConfirmRestartScreen(new_layout), on_confirm)
 
     async def _handle_clear(self) -> None:
-        await self.query_one("#ticket-rail", TicketRail).clear_tickets()
+        await self._ticket_rail.clear_tickets()
         if self._active_mode and self._agent:
             await self._agent.clear_history()
             self.notify("Context cleared")
 
         if self._layout == TUILayout.FULL_KITCHEN:
             try:
-                self.query_one("#the-plate", ThePlate).clear_plate()
-                self.query_one("#the-pass", ThePass).reset_all()
+                self._plate.clear_plate()
+                self._the_pass.reset_all()
             except Exception:
                 pass
 
     async def _show_modes(self) -> None:
         """Show available modes with current mode highlighted."""
-        current = self._mode_manager.current_mode
-        lines = [
-            "## 🔄 Available Modes",
-            "",
-            "Press **Shift+Tab** to cycle through modes:",
-            "",
-        ]
-
-        for mode in MODE_CYCLE_ORDER:
-            config = MODE_CONFIGS[mode]
-            marker = "▶" if mode == current else " "
-            lines.append(
-                f"{marker} {config.emoji} **{mode.value.upper()}**: {config.description}"
-            )
-
-        lines.extend(["", "---", f"Current: **{current.value.upper()}**"])
-        self.query_one("#ticket-rail", TicketRail).add_system_message("\n".join(lines))
+        self._ticket_rail.add_system_message(
+            _MODES_OVERVIEWS[self._mode_manager.current_mode]
+        )
 
     async def _show_status(self) -> None:
         """Show session status."""
-        mode = self._mode_manager.current_mode
+        mode_manager = self._mode_manager
+        mode = mode_manager.current_mode
         config = MODE_CONFIGS[mode]
-        auto = "ON" if self._mode_manager.auto_approve else "OFF"
-
-        status = f"""## 📊 Session Status
 
-**Mode**: {config.emoji} {mode.value.upper()}
-**Auto-Approve**: {auto}
-**Kitchen**: {"Ready" if self._bus else "Initializing..."}
-"""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(status)
+        status = _SESSION_STATUS_TEMPLATE.format(
+            emoji=config.emoji,
+            mode=mode.value.upper(),
+            auto="ON" if mode_manager.auto_approve else "OFF",
+            kitchen="Ready" if self._bus else "Initializing...",
+        )
+        self._ticket_rail.add_system_message(status)
 
     async def _show_wisdom(self) -> None:
         """Show chef wisdom."""
-        import random
-
-        wisdoms = [
-            '🧑‍🍳 "Mise en place is not just for cooking—it\'s for coding too."',
-            '🔪 "Sharp tools, sharp code. Keep your dependencies updated."',
-            '🍳 "Low and slow wins the race. Don\'t rush your tests."',
-            '🧂 "Season to taste. Iterate based on feedback."',
-            '🍲 "A watched pot never boils. A watched CI never finishes."',
-            '👨‍🍳 "Every chef was once a dishwasher. Keep refactoring."',
-        ]
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            random.choice(wisdoms)
-        )
+        self._ticket_rail.add_system_message(_random_choice(_WISDOMS))
 
     async def _show_roast(self) -> None:
         """Get roasted by Gordon."""
-        import random
-
-        roasts = [
-            '🔥 "This code is so raw, it\'s still mooing!"',
-            '🔥 "I\'ve seen better architecture in a sandcastle!"',
-            '🔥 "WHERE IS THE ERROR HANDLING?!"',
-            '🔥 "This function is so long, it needs a GPS!"',
-            '🔥 "You call that a commit message? Pathetic!"',
-            '🔥 "My grandmother writes cleaner Python, and she\'s a COBOL developer!"',
-        ]
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            random.choice(roasts)
-        )
+        self._ticket_rail.add_system_message(_random_choice(_ROASTS))
 
     async def _show_fortune(self) -> None:
         """Developer fortune cookie."""
-        import random
-
-        fortunes = [
-            "🥠 Your next merge conflict will resolve itself peacefully.",
-            "🥠 The bug you've been hunting is in the file you refuse to check.",
-            "🥠 A refactor is in your future. Embrace it.",
-            "🥠 Your deployment will succeed on the first try (just kidding).",
-            "🥠 The documentation you need has not been written yet.",
-            "🥠 Someone will appreciate your comment today.",
-        ]
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            random.choice(fortunes)
-        )
+        self._ticket_rail.add_system_message(_random_choice(_FORTUNES))
 
     async def _show_chef_status(self) -> None:
         """Show chef/kitchen status."""
-        mode = self._mode_manager.current_mode
+        mode_manager = self._mode_manager
+        mode = mode_manager.current_mode
         config = MODE_CONFIGS[mode]
-        auto = "ON" if self._mode_manager.auto_approve else "OFF"
+        auto = "ON" if mode_manager.auto_approve else "OFF"
         bus_status = (
             "🟢 Running" if self._bus and self._bus.is_running else "🔴 Not Ready"
         )
 
-        status = f"""## 👨‍🍳 Kitchen Status
-
-**Current Mode**: {config.emoji} {mode.value.upper()}
-**Description**: {config.description}
-**Auto-Approve**: {auto}
-**Kitchen Bus**: {bus_status}
-
----
-*Press Shift+Tab to cycle modes*
-"""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(status)
+        status = _CHEF_STATUS_TEMPLATE.format(
+            emoji=config.emoji,
+            mode=mode.value.upper(),
+            description=config.description,
+            auto=auto,
+            bus_status=bus_status,
+        )
+        self._ticket_rail.add_system_message(status)
 
     async def _show_model_info(self) -> None:
         """Show current model information."""
-        info = """## 🤖 Model Information
-
-**Status**: Model information not available in TUI mode.
-
-Use the **REPL** (`uv run vibe`) for full model configuration.
-"""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(info)
+        self._ticket_rail.add_system_message(_MODEL_INFO)
 
     async def _show_config(self) -> None:
         """Show configuration info."""
-        mode = self._mode_manager.current_mode
+        mode_manager = self._mode_manager
+        mode = mode_manager.current_mode
         config = MODE_CONFIGS[mode]
 
-        info = f"""## ⚙️ Configuration
-
-**Mode**: {config.emoji} {mode.value.upper()}
-**Auto-Approve**: {"ON" if self._mode_manager.auto_approve else "OFF"}
-
----
-*Use the REPL for full configuration options*
-"""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(info)
+        info = _CONFIG_TEMPLATE.format(
+            emoji=config.emoji,
+            mode=mode.value.upper(),
+            auto="ON" if mode_manager.auto_approve else "OFF",
+        )
+        self._ticket_rail.add_system_message(info)
 
     async def _show_log_path(self) -> None:
         """Show the current log path."""
-        log_dir = TUI_PREFS_FILE.parent / "logs"
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            f"## 📝 Kitchen Logs\n\n"
-            f"Logs are stored in:\n`{log_dir}`\n\n"
-            f"*Check these for details if the soufflé collapses.*"
-        )
+        self._ticket_rail.add_system_message(_LOG_PATH_INFO)
 
     async def _chef_taste(self) -> None:
         """Trigger the Expeditor to run taste tests."""
         if not self._brigade:
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
-                "⚠️ **Expeditor not available**\n\n"
-                "The kitchen brigade is not fully assembled. Run with `uv run vibe` for full kitchen experience."
-            )
+            self._ticket_rail.add_system_message(_EXPEDITOR_UNAVAILABLE)
             return
 
         # Trigger taste test
-        ticket_id = str(uuid4())[:8]
-        message = ChefMessage(
-            sender="tui",
-            recipient="expeditor",
-            action="TASTE_TEST",  # Matches BusAction.TASTE_TEST
-            # Default to running pytest and ruff on current directory
-            payload={"ticket_id": ticket_id, "tests": ["pytest", "ruff"], "path": "."},
-            priority=MessagePriority.HIGH,
-        )
-
-        await self._bus.publish(message)
+        ticket_id = secrets.token_hex(4)
+        await self._bus.publish(self._build_taste_test_msg(ticket_id))
         try:
-            self.query_one("#ticket-rail", TicketRail).add_system_message(
+            self._ticket_rail.add_system_message(
                 f"🥄 **Taste Test Ordered** (Ticket #{ticket_id})\n\n"
                 "Expeditor is checking the dish (running tests & linting)..."
             )
@@ -1044,44 +1375,61 @@ Use the **REPL** (`uv run vibe`) for full model configuration.
 
     async def _chef_timer(self, arg: str) -> None:
         """Show timer info."""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            "## ⏱️ Kitchen Timer\n\n"
-            "Kitchen timer is coming soon to the TUI!\n"
-            "Use it to track long-running tasks or just to boil an egg perfectly."
-        )
+        self._ticket_rail.add_system_message(_TIMER_INFO)
 
     async def _reload_config(self) -> None:
         """Reload configuration."""
         # For TUI, most config is loaded on startup, but we can refresh modes
         self.notify("Reloading configuration...", title="System")
-        self._mode_manager = ModeManager(initial_mode=self._mode_manager.current_mode)
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            "🔄 **Configuration Reloaded**"
-        )
+        self._mode_manager.reset()
+        self._ticket_rail.add_system_message("🔄 **Configuration Reloaded**")
 
     async def _compact_history(self) -> None:
         """Compact conversation history."""
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
+        self._ticket_rail.add_system_message(
             "🗜️ **Compacting History**\n\nCompressing the conversation context..."
         )
         # TODO: Implement actual compaction via Bus/Agent
         # For now, we simulate it
         await asyncio.sleep(1)
-        self.query_one("#ticket-rail", TicketRail).add_system_message(
-            "✅ History compacted."
-        )
+        self._ticket_rail.add_system_message("✅ History compacted.")
 
     async def _shutdown(self) -> None:
-        """Gracefully shutdown the kitchen."""
+        """Gracefully shutdown the kitchen; concurrent callers share one run."""
+        await asyncio.shield(self._begin_shutdown())
+
+    def _begin_shutdown(self) -> asyncio.Task[None]:
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(self._run_shutdown())
+        return self._shutdown_task
+
+    async def _run_shutdown(self) -> None:
+        if self._bus_drain_task:
+            self._bus_drain_task.cancel()
+            self._bus_drain_task = None
+        # Agent re-inits are abandoned rather than awaited on the way out
+        for task in (self._model_switch_task, self._onboarding_task):
+            if task and not task.done():
+                task.cancel()
+        # Let clears settle before teardown, but never hang the exit on them
+        if self._settle_tasks:
+            await asyncio.wait(set(self._settle_tasks), timeout=SHUTDOWN_SETTLE_TIMEOUT)
+        try:
+            await asyncio.wait_for(self._flush_active_model(), SHUTDOWN_SETTLE_TIMEOUT)
+        except Exception as e:
+            logger.warning("Failed to save active model on shutdown: %s", e)
         if self._brigade:
             await self._brigade.close_kitchen()
         elif self._bus:
             await self._bus.stop()
 
     def action_quit(self) -> None:
+        if self._shutdown_task is not None:
+            return  # Already on the way out; a second Ctrl+Q changes nothing
         if self._brigade or self._bus:
-            # Schedule shutdown and then exit
-            self.call_after_refresh(lambda: asyncio.create_task(self._shutdown()))
+            # Exit only once the kitchen is closed, so nothing is left dangling
+            self._begin_shutdown().add_done_callback(lambda _: self.exit())
+            return
         self.exit()
 
     def action_cancel(self) -> None:
@@ -1091,71 +1439,56 @@ Use the **REPL** (`uv run vibe`) for full model configuration.
         self._enter_cancelling()
 
         # Request cancellation from backend first (best effort).
-        try:
-            if self._bus and self._state.ticket_id:
-                cancel_msg = ChefMessage(
-                    sender="tui",
-                    recipient="sous_chef",
-                    action=BusAction.CANCEL_TICKET.value,
-                    payload={PayloadKey.TICKET_ID: self._state.ticket_id},
-                    priority=MessagePriority.HIGH,
-                )
-                asyncio.create_task(self._bus.publish(cancel_msg))
-        except Exception:
-            pass
+        if self._bus and (ticket_id := self._state.ticket_id):
+            cancel_msg = ChefMessage(
+                sender="tui",
+                recipient="sous_chef",
+                action=BusAction.CANCEL_TICKET.value,
+                payload={PayloadKey.TICKET_ID: ticket_id},
+                priority=MessagePriority.HIGH,
+            )
+            self._bus.publish_nowait(cancel_msg)
 
         self._enter_idle()
+        # Processing always started the loader and used the rail, so both
+        # lookups are already cached; one guard covers the UI teardown.
         try:
-            self.query_one(WhiskLoader).stop()
-        except Exception:
-            pass
-
-        try:
-            self.query_one("#ticket-rail", TicketRail).finish_streaming_message()
-        except Exception:
-            pass
-
-        try:
+            self._loader.stop()
+            self._ticket_rail.finish_streaming_message()
             self.notify("Cancelled. Kitchen stopped.", timeout=2)
-        except Exception:
-            pass
+        except Exception as exc:
+            logger.debug("Error resetting UI after cancel: %s", exc)
 
     def action_clear(self) -> None:
-        asyncio.create_task(self._handle_clear())
+        self._spawn(self._handle_clear(), settle=True)
 
     def action_focus_input(self) -> None:
         if self._state.is_processing:
             self.action_cancel()
             return
 
-        self.query_one("#command-input", CommandInput).focus()
+        self._command_input.focus()
 
     def action_cycle_mode(self) -> None:
         """Cycle through available modes (Shift+Tab)."""
         try:
-            _old_mode, new_mode = self._mode_manager.cycle_mode()
-            config = MODE_CONFIGS.get(new_mode)
+            mode_manager = self._mode_manager
+            _old_mode, new_mode = mode_manager.cycle_mode()
+            notice = _MODE_CHANGED_NOTICES.get(new_mode)
 
-            if config is None:
+            if notice is None:
                 return
 
             if self._agent:
-                self._agent.auto_approve = self._mode_manager.auto_approve
+                self._agent.auto_approve = mode_manager.auto_approve
 
-            # Update the KitchenFooter silently
-            try:
-                footer = self.query_one("#kitchen-footer", KitchenFooter)
-                footer.refresh_mode()
-                footer.refresh()
-            except Exception:
-                pass
+            # The footer is composed in every layout
+            footer = self._footer
+            footer.refresh_mode()
+            footer.refresh()
 
             # Show notification (this is the most reliable feedback)
-            self.notify(
-                f"{config.emoji} {new_mode.value.upper()}: {config.description}",
-                title="Mode Changed",
-                timeout=2,
-            )
+            self.notify(notice, title="Mode Changed", timeout=2)
 
         except Exception as e:
             # Catch any unexpected error so we don't crash
@@ -1163,24 +1496,31 @@ Use the **REPL** (`uv run vibe`) for full model configuration.
 
     async def _setup_brigade(self) -> None:
         """Initialize the full Brigade for active mode."""
-        # Load API keys from .env files
-        try:
-            load_api_keys_from_env()
-        except Exception as e:
-            logger.warning("Could not load API keys from .env: %s", e)
+        # Load API keys from .env files while the brigade is being built;
+        # stations only read the environment once the kitchen is open.
+        env_task = asyncio.create_task(asyncio.to_thread(_load_api_keys_once))
 
         # Create and start the brigade
-        self._brigade = await create_default_brigade()
+        try:
+            self._brigade = await create_default_brigade()
+        finally:
+            try:
+                await env_task
+            except Exception as e:
+                logger.warning("Could not load API keys from .env: %s", e)
+
         self._bus = self._brigade.bus
-        self._bus.subscribe("tui", self._handle_bus_message)
+        self._bus.subscribe("tui", self._enqueue_bus_message)
         await self._brigade.open_kitchen()
 
-        # Log brigade status
-        logger.info(
-            "Brigade started with %d stations: %s",
-            self._brigade.station_count,
-            self._brigade.station_names,
-        )
+        # Log brigade status (station_names copies the registry, so skip it
+        # entirely when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Brigade started with %d stations: %s",
+                self._brigade.station_count,
+                self._brigade.station_names,
+            )
 
 
 def run(
@@ -1200,11 +1540,16 @@ def run(
     if verbose:
         logging.basicConfig(level=logging.DEBUG)
 
+    # uvloop is optional; when installed it gives the bus and agent stream a
+    # faster event loop. Textual's App.run() picks the policy up.
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     if layout:
         save_tui_preference("layout", layout)
+    current_layout = layout or get_saved_layout()
 
     while True:
-        current_layout = get_saved_layout()
         layout_mode = (
             TUILayout.FULL_KITCHEN
             if current_layout == "kitchen"
@@ -1216,6 +1561,7 @@ def run(
         try:
             result = app.run()
             if result == "RESTART":
+                current_layout = app._restart_layout or current_layout
                 continue
             break
         except KeyboardInterrupt:
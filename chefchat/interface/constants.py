@@ -6,7 +6,9 @@ throughout the TUI codebase, improving maintainability and type safety.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import Enum, auto
+from types import MappingProxyType
 from typing import Final
 
 from chefchat.core.compatibility import StrEnum
@@ -133,6 +135,21 @@ STATUS_EMOJI: Final[dict[str, str]] = {
     StatusString.ERROR.value: "❌",
 }
 
+# Backend status string -> TUI station status (read-only)
+STATION_STATUS_MAP: Final[Mapping[str, StationStatus]] = MappingProxyType({
+    StatusString.IDLE.value: StationStatus.IDLE,
+    StatusString.PLANNING.value: StationStatus.WORKING,
+    StatusString.COOKING.value: StationStatus.WORKING,
+    StatusString.TESTING.value: StationStatus.WORKING,
+    StatusString.REFACTORING.value: StationStatus.WORKING,
+    "verifying": StationStatus.WORKING,
+    "researching": StationStatus.WORKING,
+    "auditing": StationStatus.WORKING,
+    StatusString.COMPLETE.value: StationStatus.COMPLETE,
+    StatusString.ERROR.value: StationStatus.ERROR,
+    "ready": StationStatus.COMPLETE,
+})
+
 # Ticket type emojis
 TICKET_EMOJI: Final[dict[str, str]] = {
     "user": "👨‍🍳",
@@ -66,10 +66,11 @@ class ModelSelectionScreen(ModalScreen[str | None]):
 
             with VerticalScroll():
                 with RadioSet(id="model-radios"):
+                    active_alias = self._config.active_model
                     for model in self._config.models:
                         label = f"{model.alias} ({model.provider})"
                         # Check if this is the active model
-                        is_active = model.alias == self._config.active_model
+                        is_active = model.alias == active_alias
                         yield RadioButton(label, value=is_active, id=f"model-{model.alias}")
 
             with Container(id="models-buttons"):
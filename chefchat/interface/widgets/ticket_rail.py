@@ -37,7 +37,7 @@ TICKET_EMOJI: dict[MessageType, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketMessage:
     """A single message in the ticket rail."""
 
@@ -191,13 +191,12 @@ class TicketRail(VerticalScroll):
         Returns:
             The created Ticket widget
         """
-        # Remove empty state on first message via update logic
-
         message = TicketMessage(content=content, ticket_type=ticket_type)
         self._messages.append(message)
 
-        # Update empty state
-        self._update_empty_state()
+        # Only the first ticket changes the empty state; skip the query otherwise
+        if len(self._messages) == 1:
+            self._update_empty_state()
 
         ticket = Ticket(
             content=content, ticket_type=ticket_type, timestamp=message.timestamp
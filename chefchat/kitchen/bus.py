@@ -75,7 +75,7 @@ class ChefMessage(BaseModel):
         return v
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class PrioritizedMessage:
     """Wrapper for priority queue ordering."""
 
@@ -106,6 +106,17 @@ class KitchenBus:
         prioritized = PrioritizedMessage(priority=message.priority, message=message)
         await self._queue.put(prioritized)
 
+    def publish_nowait(self, message: ChefMessage) -> None:
+        """Publish a message from synchronous code.
+
+        The queue is unbounded, so this never blocks or drops the message.
+
+        Args:
+            message: The ChefMessage to send
+        """
+        prioritized = PrioritizedMessage(priority=message.priority, message=message)
+        self._queue.put_nowait(prioritized)
+
     def subscribe(
         self, station_name: str, callback: Callable[[ChefMessage], None]
     ) -> None:
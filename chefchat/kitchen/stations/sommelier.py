@@ -77,7 +77,7 @@ class Sommelier(BaseStation):
 
         await self.send(
             recipient="tui",
-            action="status_update",
+            action="STATUS_UPDATE",
             payload={
                 "station": self.name,
                 "status": "verifying",
@@ -164,7 +164,7 @@ class Sommelier(BaseStation):
 
         await self.send(
             recipient="tui",
-            action="status_update",
+            action="STATUS_UPDATE",
             payload={
                 "station": self.name,
                 "status": "researching",
@@ -200,7 +200,7 @@ class Sommelier(BaseStation):
             # Announce completion
             await self.send(
                 recipient="tui",
-                action="status_update",
+                action="STATUS_UPDATE",
                 payload={
                     "station": self.name,
                     "status": "complete",
@@ -235,7 +235,7 @@ class Sommelier(BaseStation):
 
         await self.send(
             recipient="tui",
-            action="status_update",
+            action="STATUS_UPDATE",
             payload={
                 "station": self.name,
                 "status": "auditing",
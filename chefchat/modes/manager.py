@@ -112,6 +112,14 @@ class ModeManager:
         self.state.started_at = now
         self.state.mode_history.append((mode, now))
 
+    def reset(self) -> None:
+        """Reset state to the current mode's defaults, in place.
+
+        Clears the transition history while keeping this manager instance,
+        so widgets and agents holding a reference stay in sync.
+        """
+        self.state = ModeState(current_mode=self.state.current_mode)
+
     # -------------------------------------------------------------------------
     # Tool Permission Checks
     # -------------------------------------------------------------------------
@@ -135,6 +135,63 @@ class TestEasterEggCommands:
         assert "NORMAL" in display or "normal" in display.lower()
 
 
+# =============================================================================
+# COMMAND REGISTRY TESTS
+# =============================================================================
+
+
+class TestCommandRegistry:
+    """Test slash-command lookup in the shared command registry."""
+
+    def test_get_command_resolves_primary_names_and_aliases(self) -> None:
+        """Every alias of a command resolves to the same Command object."""
+        from chefchat.cli.commands import CommandRegistry
+
+        registry = CommandRegistry()
+        exit_cmd = registry.commands["exit"]
+
+        assert registry.get_command("/exit") is exit_cmd
+        assert registry.get_command("/quit") is exit_cmd
+        assert registry.get_command("/q") is exit_cmd
+        assert registry.get_command("/help") is registry.commands["help"]
+
+    def test_get_command_returns_none_for_unknown_aliases(self) -> None:
+        """Unknown and excluded aliases are not found."""
+        from chefchat.cli.commands import CommandRegistry
+
+        registry = CommandRegistry(excluded_commands=["timer"])
+
+        assert registry.get_command("/nope") is None
+        assert registry.get_command("/timer") is None
+        assert registry.get_command("help") is None
+
+    def test_get_command_expects_normalized_input(self) -> None:
+        """get_command skips the normalization that find_command applies."""
+        from chefchat.cli.commands import CommandRegistry
+
+        registry = CommandRegistry()
+
+        assert registry.get_command(" /HELP ") is None
+        assert registry.find_command(" /HELP ") is registry.get_command("/help")
+
+    def test_help_text_is_built_once_and_cached(self) -> None:
+        """get_help_text renders the same text as a fresh build, only once."""
+        from chefchat.cli.commands import CommandRegistry
+
+        registry = CommandRegistry(excluded_commands=["timer"])
+
+        with patch.object(
+            registry, "_build_help_text", wraps=registry._build_help_text
+        ) as build:
+            first = registry.get_help_text()
+            second = registry.get_help_text()
+
+        build.assert_called_once_with()
+        assert second is first
+        assert first == registry._build_help_text()
+        assert "`/exit`" in first and "`/timer`" not in first
+
+
 # =============================================================================
 # ERROR HANDLER TESTS
 # =============================================================================
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
@@ -77,3 +78,668 @@ async def test_chef_taste_command(app):
     call_args = app._bus.publish.call_args[0][0]
     assert call_args.action == "TASTE_TEST"
     assert call_args.recipient == "expeditor"
+
+
+@pytest.mark.asyncio
+async def test_tool_approval_callback_resolves_from_screen_result(app):
+    """On the app loop the approval screen is pushed directly and awaited."""
+
+    def fake_push_screen(screen, callback):
+        callback(("y", None))
+
+    app.push_screen = MagicMock(side_effect=fake_push_screen)
+
+    result = await app._tool_approval_callback("bash", {"command": "ls"})
+
+    assert result == ("y", None)
+    app.push_screen.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_tool_approval_callback_hops_loops_when_off_app_loop(app):
+    """From a foreign loop the screen is scheduled on the app loop instead."""
+    app_loop = MagicMock()
+    app_loop.call_soon_threadsafe.side_effect = lambda fn, *args: fn(*args)
+    app._loop = app_loop
+    app.push_screen = MagicMock(side_effect=lambda screen, cb: cb(("n", "no")))
+
+    result = await app._tool_approval_callback("bash", {"command": "rm"})
+
+    assert result == ("n", "no")
+    app_loop.call_soon_threadsafe.assert_called_once()
+
+
+def test_bus_dispatch_specialized_per_layout():
+    """Kitchen-only bus actions are not routed in the chat-only layout."""
+    from chefchat.interface.constants import BusAction, TUILayout
+
+    chat = ChefChatApp(layout=TUILayout.CHAT_ONLY)
+    kitchen = ChefChatApp(layout=TUILayout.FULL_KITCHEN)
+
+    assert BusAction.PLATE_CODE.value not in chat._bus_dispatch
+    assert BusAction.LOG_MESSAGE.value in chat._bus_dispatch
+    assert BusAction.PLATE_CODE.value in kitchen._bus_dispatch
+    assert BusAction.STREAM_UPDATE.value in kitchen._bus_dispatch
+
+
+def test_coalesce_stream_updates_merges_adjacent_chunks():
+    """Adjacent STREAM_UPDATE chunks for one file collapse into a single update."""
+    from chefchat.interface.app import _coalesce_stream_updates
+    from chefchat.interface.constants import BusAction
+    from chefchat.kitchen.bus import ChefMessage
+
+    def stream(code: str, path: str = "a.py") -> ChefMessage:
+        return ChefMessage(
+            sender="line_cook",
+            recipient="tui",
+            action=BusAction.STREAM_UPDATE.value,
+            payload={"code": code, "file_path": path},
+        )
+
+    log = ChefMessage(
+        sender="sous_chef", recipient="tui", action=BusAction.LOG_MESSAGE.value
+    )
+    batch = [stream("a"), stream("b"), log, stream("c"), stream("d", "b.py")]
+
+    merged = _coalesce_stream_updates(batch)
+
+    assert [m.payload.get("code") for m in merged] == ["ab", None, "c", "d"]
+
+
+def test_coalesce_stream_updates_keeps_newest_chunk_keys():
+    """Merged code chunks carry the latest chunk's other payload keys."""
+    from chefchat.interface.app import _coalesce_stream_updates
+    from chefchat.interface.constants import BusAction
+    from chefchat.kitchen.bus import ChefMessage
+
+    first, second = (
+        ChefMessage(
+            sender="line_cook",
+            recipient="tui",
+            action=BusAction.STREAM_UPDATE.value,
+            payload={"code": code, "file_path": "a.py", "language": language},
+        )
+        for code, language in (("a", "text"), ("b", "python"))
+    )
+
+    (merged,) = _coalesce_stream_updates([first, second])
+
+    assert merged.payload == {"code": "ab", "file_path": "a.py", "language": "python"}
+
+
+def test_coalesce_stream_updates_passes_station_content_chunks_through():
+    """Station content/full_content updates are never merged or altered."""
+    from chefchat.interface.app import _coalesce_stream_updates
+    from chefchat.interface.constants import BusAction
+    from chefchat.kitchen.bus import ChefMessage
+
+    # Payload shape sent by LineCook._generate_code and the Sommelier
+    batch = [
+        ChefMessage(
+            sender="line_cook",
+            recipient="tui",
+            action=BusAction.STREAM_UPDATE.value,
+            payload={"content": chunk, "full_content": full},
+        )
+        for chunk, full in (("def f", "def f"), ("():", "def f():"))
+    ]
+
+    merged = _coalesce_stream_updates(batch)
+
+    assert merged == batch
+    assert [m.payload for m in merged] == [
+        {"content": "def f", "full_content": "def f"},
+        {"content": "():", "full_content": "def f():"},
+    ]
+
+
+def test_state_transitions_mutate_in_place(app):
+    """State transitions reuse one state object and snapshots stay immutable."""
+    from chefchat.interface.app import AppStateKind
+
+    live = app._state
+    app._enter_running("abc12345")
+    snapshot = app.state
+    app._enter_cancelling()
+
+    assert app._state is live
+    assert app._state.kind is AppStateKind.CANCELLING
+    assert app._state.ticket_id == "abc12345"
+    assert snapshot.kind is AppStateKind.RUNNING
+
+    app._enter_idle()
+    assert not app._state.is_processing
+    assert app._state.ticket_id is None
+
+
+@pytest.mark.asyncio
+async def test_ticket_rail_lookup_is_cached(app):
+    """Repeated handlers reuse the first ticket rail lookup."""
+    with patch.object(app, "query_one", return_value=MagicMock()) as mock_query:
+        await app._show_status()
+        await app._show_config()
+
+    mock_query.assert_called_once_with("#ticket-rail", ANY)
+
+
+@pytest.mark.asyncio
+async def test_spawn_tracks_task_until_done(app):
+    """Background tasks are strongly referenced until they complete."""
+
+    async def work() -> None:
+        return None
+
+    task = app._spawn(work())
+    assert task in app._pending_tasks
+
+    await task
+    assert task not in app._pending_tasks
+
+
+@pytest.mark.asyncio
+async def test_ensure_config_reloads_only_when_file_changes(app):
+    """The config is cached until config.toml's mtime changes."""
+    mtimes = iter([1, 1, 2, 2, 2])
+    with (
+        patch("chefchat.interface.app._config_file_mtime", lambda: next(mtimes)),
+        patch("chefchat.interface.app.VibeConfig.load", side_effect=[1, 2]) as load,
+    ):
+        assert await app._ensure_config() == 1
+        assert await app._ensure_config() == 1
+        assert await app._ensure_config() == 2
+
+    assert load.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rapid_model_selections_save_once(app):
+    """Successive /model picks are debounced into a single config write."""
+    app._ensure_config = AsyncMock(return_value=MagicMock(active_model="a"))
+    app._config = app._ensure_config.return_value
+    app.push_screen = AsyncMock()
+    app.notify = MagicMock()
+    await app._handle_model_command()
+    on_model_selected = app.push_screen.call_args.args[1]
+
+    with patch("chefchat.interface.app.VibeConfig.save_updates") as save:
+        on_model_selected("a")
+        assert app._model_switch_task is None
+
+        on_model_selected("b")
+        on_model_selected("c")
+        await app._shutdown()
+
+    save.assert_called_once_with({"active_model": "c"})
+    assert app._unsaved_model_alias is None
+
+
+def test_cycle_mode_uses_prebuilt_notice(app):
+    """Shift+Tab notifies with the precomputed text for the new mode."""
+    from chefchat.modes import MODE_CONFIGS
+
+    app.notify = MagicMock()
+    app._footer = MagicMock()
+    app.action_cycle_mode()
+
+    app._footer.refresh_mode.assert_called_once()
+    mode = app._mode_manager.current_mode
+    config = MODE_CONFIGS[mode]
+    app.notify.assert_called_once_with(
+        f"{config.emoji} {mode.value.upper()}: {config.description}",
+        title="Mode Changed",
+        timeout=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_tracked_tasks(app):
+    """Ctrl+L work is tracked and finished before the kitchen shuts down."""
+    finished = []
+
+    async def clear() -> None:
+        await asyncio.sleep(0)
+        finished.append(True)
+
+    app._handle_clear = clear
+    app.action_clear()
+    assert len(app._pending_tasks) == 1
+
+    await app._shutdown()
+
+    assert finished == [True]
+    assert not app._pending_tasks
+
+
+@pytest.mark.asyncio
+async def test_quit_exits_after_kitchen_shutdown(app):
+    """Quitting awaits the kitchen shutdown before the app exits."""
+    calls = []
+    app._bus.stop = AsyncMock(side_effect=lambda: calls.append("stop"))
+    app.exit = MagicMock(side_effect=lambda: calls.append("exit"))
+
+    app.action_quit()
+    await app._shutdown_task
+    await asyncio.sleep(0)  # let the exit callback run
+
+    assert calls == ["stop", "exit"]
+
+
+def test_cancel_stops_loader_and_stream(app):
+    """Escape while cooking stops the loader and closes the streamed reply."""
+    loader, rail = MagicMock(), MagicMock()
+    app._loader, app._ticket_rail = loader, rail
+    app._enter_running(None)
+    app.notify = MagicMock()
+
+    app.action_cancel()
+
+    loader.stop.assert_called_once_with()
+    rail.finish_streaming_message.assert_called_once_with()
+    assert not app._state.is_processing
+
+
+def test_run_relaunches_with_chosen_layout_without_rereading_prefs():
+    """A layout restart reuses the in-memory choice instead of tui_prefs.json."""
+    from chefchat.interface import app as app_module
+    from chefchat.interface.constants import TUILayout
+
+    layouts = []
+
+    def fake_run(self):
+        layouts.append(self._layout)
+        if len(layouts) == 1:
+            self._restart_layout = "kitchen"
+            return "RESTART"
+        return None
+
+    with (
+        patch.object(app_module, "get_saved_layout", return_value="chat") as saved,
+        patch.object(ChefChatApp, "run", fake_run),
+    ):
+        app_module.run()
+
+    saved.assert_called_once_with()
+    assert layouts == [TUILayout.CHAT_ONLY, TUILayout.FULL_KITCHEN]
+
+
+def test_sanitize_markdown_input_strips_control_chars_and_ansi():
+    """Control characters and ANSI escapes are removed in one sanitize call."""
+    from chefchat.interface.app import sanitize_markdown_input
+
+    assert sanitize_markdown_input("a\0b\x0bc\x0cd\x1bMe") == "abcde"
+    # Control characters are deleted before the ANSI pattern is matched, so an
+    # escape sequence split by a NUL is still recognised and stripped
+    assert sanitize_markdown_input("\x1b\0Mx") == "x"
+
+
+@pytest.mark.asyncio
+async def test_bus_message_dispatch_accepts_any_action_case(app):
+    """Canonical actions hit the table directly; other spellings still route."""
+    from chefchat.kitchen.bus import ChefMessage
+
+    handler = AsyncMock()
+    app._bus_dispatch = {"LOG_MESSAGE": handler}
+
+    for action in ("LOG_MESSAGE", "log_message"):
+        await app._handle_bus_message(
+            ChefMessage(sender="x", recipient="tui", action=action, payload={})
+        )
+
+    assert handler.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_token_buffer_renders_once_per_frame():
+    """Tokens arriving within one frame reach the ticket rail as one update."""
+    from chefchat.interface.app import STREAM_FLUSH_INTERVAL, _TokenBuffer
+
+    sink = MagicMock()
+    tokens = _TokenBuffer(sink)
+    for token in ("Hel", "lo", " chef"):
+        tokens.push(token)
+    sink.assert_not_called()
+
+    await asyncio.sleep(STREAM_FLUSH_INTERVAL * 2)
+    sink.assert_called_once_with("Hello chef")
+
+    tokens.push("!")
+    tokens.flush()
+    tokens.flush()
+    assert sink.call_args_list[-1].args == ("!",)
+    assert sink.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_station_status_lookup_is_case_insensitive():
+    """Both canonical and upper-case status strings map to a StationStatus."""
+    from chefchat.interface.constants import StationStatus, TUILayout
+
+    app = ChefChatApp(layout=TUILayout.FULL_KITCHEN)
+    app._the_pass = MagicMock()
+
+    await app._update_station_status({"station": "line_cook", "status": "cooking"})
+    await app._update_station_status({"station": "line_cook", "status": "COMPLETE"})
+    await app._update_station_status({"station": "line_cook", "status": "???"})
+
+    statuses = [c.args[1] for c in app._the_pass.update_station.call_args_list]
+    assert statuses == [
+        StationStatus.WORKING,
+        StationStatus.COMPLETE,
+        StationStatus.IDLE,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_onboarding_follow_up_is_tracked(app):
+    """Finishing onboarding is tracked, and shutdown cancels it, not awaits it."""
+    started = asyncio.Event()
+
+    async def finish(provider: str) -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    app._finish_onboarding = finish
+    app._on_onboarding_complete("mistral")
+    assert len(app._pending_tasks) == 1
+    await started.wait()
+
+    await asyncio.wait_for(app._shutdown(), 1)
+
+    assert app._onboarding_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_finish_onboarding_builds_agent_from_fresh_config(app):
+    """The config loaded after onboarding is the one the agent is built from."""
+    fresh = MagicMock()
+    fresh.get_active_model.return_value.provider = "mistral"
+    app._config, app._config_mtime = MagicMock(), 1
+    app._initialize_agent = AsyncMock()
+
+    with (
+        patch("chefchat.interface.app.load_api_keys_from_env"),
+        patch("chefchat.interface.app.VibeConfig.load", return_value=fresh),
+        patch("chefchat.interface.app._config_file_mtime", return_value=1),
+    ):
+        await app._finish_onboarding("mistral")
+        assert await app._ensure_config() is fresh
+
+
+@pytest.mark.asyncio
+async def test_bash_commands_reuse_one_executor(app):
+    """The `!` executor is created on first use and reused afterwards."""
+    app._ticket_rail, app._loader = MagicMock(), MagicMock()
+    with patch("chefchat.core.tools.executor.SecureCommandExecutor") as executor_cls:
+        executor_cls.return_value.execute = AsyncMock(return_value=("", "", 0))
+        await app._handle_bash_command("!ls")
+        await app._handle_bash_command("!pwd")
+
+    executor_cls.assert_called_once()
+    assert executor_cls.return_value.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_slash_commands_skip_upfront_sanitizing(app):
+    """Slash commands route raw; only unknown names are sanitized when echoed."""
+    event = MagicMock()
+    event.input.id = "command-input"
+    event.value = "/nope\x0b"
+    app._ticket_rail = MagicMock()
+
+    with patch(
+        "chefchat.interface.app.sanitize_markdown_input", wraps=lambda t: t.strip()
+    ) as sanitize:
+        await app.handle_input(event)
+
+    sanitize.assert_called_once_with("/nope")
+    assert event.input.value == ""
+    assert "`/nope`" in app._ticket_rail.add_system_message.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_repeated_onboarding_supersedes_in_flight_init(app):
+    """A second /api completion cancels the first agent re-init."""
+    started = asyncio.Event()
+
+    async def finish(provider: str) -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    app._finish_onboarding = finish
+    app._on_onboarding_complete("mistral")
+    first = app._onboarding_task
+    await started.wait()
+
+    app._on_onboarding_complete("openai")
+    await asyncio.sleep(0)
+
+    assert first.cancelled()
+    app._onboarding_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_help_shows_current_layout(app):
+    from chefchat.interface.constants import TUILayout
+
+    app._layout = TUILayout.FULL_KITCHEN
+    app._ticket_rail = MagicMock()
+
+    await app._show_command_palette()
+
+    help_text = app._ticket_rail.add_system_message.call_args.args[0]
+    assert help_text.startswith("## 📋 ChefChat Commands")
+    assert f"(Current: **{TUILayout.FULL_KITCHEN.value}**)" in help_text
+
+
+@pytest.mark.asyncio
+async def test_ticket_done_stops_loader_and_finishes_stream(app):
+    app._loader = MagicMock()
+    app._ticket_rail = MagicMock()
+    app._enter_running("abc")
+
+    await app._on_ticket_done({"ticket_id": "abc"})
+
+    assert not app._state.is_processing
+    app._loader.stop.assert_called_once()
+    app._ticket_rail.finish_streaming_message.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ticket_done_logs_widget_failures(app):
+    app._loader = MagicMock()
+    app._loader.stop.side_effect = RuntimeError("unmounted")
+    app._ticket_rail = MagicMock()
+    app._enter_running("abc")
+
+    with patch("chefchat.interface.app.logger") as logger:
+        await app._on_ticket_done({"ticket_id": "abc"})
+
+    assert not app._state.is_processing
+    logger.exception.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_show_modes_marks_current_mode(app):
+    from chefchat.modes import VibeMode
+
+    app._ticket_rail = MagicMock()
+    app._mode_manager.set_mode(VibeMode.PLAN)
+
+    await app._show_modes()
+
+    overview = app._ticket_rail.add_system_message.call_args.args[0]
+    assert "▶ 📋 **PLAN**" in overview
+    assert overview.endswith("Current: **PLAN**")
+
+
+@pytest.mark.asyncio
+async def test_show_status_reports_kitchen_state(app):
+    app._ticket_rail = MagicMock()
+
+    await app._show_status()
+
+    status = app._ticket_rail.add_system_message.call_args.args[0]
+    assert status.startswith("## 📊 Session Status\n\n")
+    assert "**Auto-Approve**: " in status
+    assert status.endswith("**Kitchen**: Ready\n")
+
+
+@pytest.mark.asyncio
+async def test_handle_command_splits_name_and_argument(app):
+    app._handle_layout_command = AsyncMock()
+    app._show_command_palette = AsyncMock()
+
+    await app._handle_command("/LAYOUT   kitchen ")
+    await app._handle_command("/help")
+
+    app._handle_layout_command.assert_awaited_once_with("kitchen")
+    app._show_command_palette.assert_awaited_once_with()
+
+
+def test_env_files_are_read_once_per_process():
+    from pathlib import Path
+
+    from chefchat.interface import app as app_module
+
+    app_module._load_api_keys_once.cache_clear()
+    try:
+        with (
+            patch.object(Path, "is_file", return_value=True),
+            patch("chefchat.core.config.dotenv_values", return_value={}) as read,
+        ):
+            app_module._load_api_keys_once()
+            app_module._load_api_keys_once()
+            assert read.call_count == 2  # project and global .env, read once
+
+            # Onboarding reloads directly after saving a new key
+            app_module.load_api_keys_from_env()
+            assert read.call_count == 4
+    finally:
+        app_module._load_api_keys_once.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_cancel_enqueues_cancel_ticket_without_a_task(app):
+    from chefchat.kitchen.bus import KitchenBus
+
+    app._bus = KitchenBus()
+    app._loader, app._ticket_rail = MagicMock(), MagicMock()
+    app.notify = MagicMock()
+    app._enter_running("abc")
+
+    app.action_cancel()
+
+    assert not app._pending_tasks
+    queued = app._bus._queue.get_nowait().message
+    assert queued.action == "CANCEL_TICKET"
+    assert queued.payload == {"ticket_id": "abc"}
+
+
+@pytest.mark.asyncio
+async def test_drain_survives_coalescing_errors(app):
+    """A batch that fails to coalesce is logged and dispatched unmerged."""
+    from chefchat.kitchen.bus import ChefMessage
+
+    handled = []
+
+    async def handle(message: ChefMessage) -> None:
+        handled.append(message)
+
+    app._handle_bus_message = handle
+    message = ChefMessage(sender="sous_chef", recipient="tui", action="LOG_MESSAGE")
+
+    with (
+        patch(
+            "chefchat.interface.app._coalesce_stream_updates",
+            side_effect=TypeError("unhashable"),
+        ),
+        patch("chefchat.interface.app.logger") as logger,
+    ):
+        drain = asyncio.create_task(app._drain_bus_messages())
+        app._enqueue_bus_message(message)
+        app._enqueue_bus_message(message)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    assert not drain.done()
+    drain.cancel()
+    assert handled == [message, message]
+    logger.exception.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_model_saves_never_overlap(app):
+    """Superseding or shutting down mid-save waits for the running write."""
+    import threading
+
+    app._ensure_config = AsyncMock(return_value=MagicMock(active_model="a"))
+    app._config = app._ensure_config.return_value
+    app.push_screen = AsyncMock()
+    app.notify = MagicMock()
+    await app._handle_model_command()
+    on_model_selected = app.push_screen.call_args.args[1]
+
+    release = threading.Event()
+    writing, overlaps, written = [], [], []
+
+    def save_updates(updates: dict) -> None:
+        if writing:
+            overlaps.append(updates)
+        writing.append(updates)
+        release.wait(5)
+        written.append(updates["active_model"])
+        writing.remove(updates)
+
+    with (
+        patch("chefchat.interface.app.MODEL_SAVE_DEBOUNCE", 0),
+        patch("chefchat.interface.app.VibeConfig.save_updates", save_updates),
+    ):
+        on_model_selected("b")
+        while not writing:
+            await asyncio.sleep(0.01)
+
+        on_model_selected("c")  # cancels the task while "b" is being written
+        await asyncio.sleep(0.05)
+        assert written == [] and len(writing) == 1
+
+        release.set()
+        await app._shutdown()
+
+    assert overlaps == []
+    assert written == ["b", "c"]
+    assert app._unsaved_model_alias is None
+
+
+@pytest.mark.asyncio
+async def test_repeated_quit_shuts_down_once(app):
+    """A second Ctrl+Q before shutdown runs neither deadlocks nor re-runs it."""
+    app._bus.stop = AsyncMock()
+    app.exit = MagicMock()
+
+    app.action_quit()
+    app.action_quit()
+    await asyncio.wait_for(app._shutdown_task, 1)
+    await app._shutdown()  # on_unmount reuses the finished shutdown
+    await asyncio.sleep(0)
+
+    app._bus.stop.assert_awaited_once()
+    app.exit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_bounds_the_wait_for_clears(app):
+    """A stuck clear cannot keep the app from exiting."""
+
+    async def clear() -> None:
+        await asyncio.sleep(10)
+
+    app._handle_clear = clear
+    app.action_clear()
+    app._bus.stop = AsyncMock()
+
+    with patch("chefchat.interface.app.SHUTDOWN_SETTLE_TIMEOUT", 0.01):
+        await asyncio.wait_for(app._shutdown(), 1)
+
+    app._bus.stop.assert_awaited_once()
+    for task in app._pending_tasks:
+        task.cancel()
@@ -214,6 +214,17 @@ class TestModeManagerCycling:
         manager.cycle_mode()
         assert len(manager.state.mode_history) == initial_history_len + 2
 
+    def test_reset_keeps_mode_and_clears_history(self, manager: ModeManager) -> None:
+        """reset() restores the current mode's defaults without a new manager."""
+        manager.set_mode(VibeMode.YOLO)
+        manager.state.auto_approve = False
+
+        manager.reset()
+
+        assert manager.current_mode == VibeMode.YOLO
+        assert manager.auto_approve is True
+        assert len(manager.state.mode_history) == 1
+
 
 # =============================================================================
 # UNIT TESTS: ModeManager - Tool Permission